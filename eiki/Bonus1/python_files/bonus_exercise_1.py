@@ -176,6 +176,208 @@ islands_heuristic_bad = {
 }
 
 
+# ## Compiled graph backend
+# For large road networks the dict-of-lists maps are converted once into a `CompiledGraph`: node ids, CSR offsets and edge weights live in flat arrays and the searches work on integers only.
+# 
+# - Node ids follow the sorted node names, so ties in the heap break exactly like on the dict maps.
+# - Neighbor order of every node is kept, DFS and A* stay deterministic.
+# - A compiled graph can be passed to `depth_first_search`, `a_star_search`, `compute_true_costs` and `check_heuristic` directly.
+# 
+
+# In[ ]:
+
+
+from array import array
+
+
+class CompiledGraph:
+    '''
+    Integer-indexed graph in CSR (compressed sparse row) form.
+    names:   list of node names, id -> name
+    index:   dict name -> id (only used at the API boundary)
+    offsets: array of length V + 1, edges of node v are offsets[v]:offsets[v + 1]
+    targets: array of edge target ids
+    weights: array of edge weights
+    '''
+
+    def __init__(self, names, offsets, targets, weights):
+        self.names = names
+        self.index = {name: node_id for node_id, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_map(cls, graph):
+        '''Compile a dict[str, list[tuple[str, int]]] map.'''
+        nodes = set(graph)
+        for neighbors in graph.values():
+            nodes.update(neighbor for neighbor, _ in neighbors)
+        names = sorted(nodes)
+        index = {name: node_id for node_id, name in enumerate(names)}
+
+        offsets = array('q', [0])
+        targets = array('i')
+        weights = array('d')
+        for name in names:
+            for neighbor, cost in graph.get(name, []):
+                targets.append(index[neighbor])
+                weights.append(cost)
+            offsets.append(len(targets))
+        return cls(names, offsets, targets, weights)
+
+    @property
+    def num_nodes(self):
+        return len(self.names)
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def node_values(self, values, default=float('inf')):
+        '''Turn a per-node dict (e.g. a heuristic) into an id-indexed array.'''
+        return array('d', (values.get(name, default) for name in self.names))
+
+    def edges(self, node_id):
+        '''Yield (target_id, weight) for all outgoing edges of node_id.'''
+        for e in range(self.offsets[node_id], self.offsets[node_id + 1]):
+            yield self.targets[e], self.weights[e]
+
+    # Read-only mapping view so code written for the dict maps keeps working.
+    def __getitem__(self, name):
+        names = self.names
+        return [(names[t], w) for t, w in self.edges(self.index[name])]
+
+    def get(self, name, default=None):
+        if name not in self.index:
+            return default
+        return self[name]
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def keys(self):
+        return list(self.names)
+
+    def items(self):
+        for name in self.names:
+            yield name, self[name]
+
+
+def _heuristic_lookup(graph, heuristic):
+    '''
+    Returns a function node_id -> heuristic value for a compiled graph.
+    Accepts a dict keyed by node name, a heuristic object with a
+    lookup(graph) method, or an id-indexed sequence such as the result
+    of graph.node_values(...).
+    '''
+    if isinstance(heuristic, dict):
+        names = graph.names
+        return lambda node_id: heuristic[names[node_id]]
+    if hasattr(heuristic, 'lookup'):
+        return heuristic.lookup(graph)
+    return heuristic.__getitem__
+
+
+# ## Search instrumentation
+# `depth_first_search`, `a_star_search` and `compute_true_costs` (through `dijkstra`) accept an optional `stats=SearchStats()`. It counts expansions, pushes onto the heap or stack, stale pops, re-expansions, the peak open-set size and the wall time. After every search it calls its callbacks with the numbers of that run, e.g. to forward them to a metrics system.
+# Without `stats` the searches only pay for one `None` check per step.
+# 
+
+# In[ ]:
+
+
+import time
+
+
+class _SearchRun:
+    '''Counters of a single search, added to its SearchStats when the search ends.'''
+
+    def __init__(self, search):
+        self.search = search
+        self.started = time.perf_counter()
+        self.expansions = 0
+        self.pushes = 0
+        self.stale_pops = 0
+        self.re_expansions = 0
+        self.peak_open = 0
+        self.expanded = set()
+
+    def expand(self, node):
+        self.expansions += 1
+        if node in self.expanded:
+            self.re_expansions += 1
+        else:
+            self.expanded.add(node)
+
+    def push(self, open_size):
+        self.pushes += 1
+        if open_size > self.peak_open:
+            self.peak_open = open_size
+
+
+class SearchStats:
+    '''
+    Search counters summed over all searches run with this object.
+    callbacks: functions called as callback(search_name, run_stats) after
+               every search, run_stats is a dict with the counters of that search
+    '''
+
+    def __init__(self, callbacks=()):
+        self.callbacks = list(callbacks)
+        self.reset()
+
+    def reset(self):
+        self.searches = 0
+        self.expansions = 0
+        self.pushes = 0
+        self.stale_pops = 0
+        self.re_expansions = 0
+        self.peak_open = 0
+        self.wall_time = 0.0
+
+    def start(self, search):
+        return _SearchRun(search)
+
+    def finish(self, run):
+        wall_time = time.perf_counter() - run.started
+        self.searches += 1
+        self.expansions += run.expansions
+        self.pushes += run.pushes
+        self.stale_pops += run.stale_pops
+        self.re_expansions += run.re_expansions
+        self.peak_open = max(self.peak_open, run.peak_open)
+        self.wall_time += wall_time
+        if self.callbacks:
+            run_stats = {
+                "expansions": run.expansions,
+                "pushes": run.pushes,
+                "stale_pops": run.stale_pops,
+                "re_expansions": run.re_expansions,
+                "peak_open": run.peak_open,
+                "wall_time": wall_time,
+            }
+            for callback in self.callbacks:
+                callback(run.search, run_stats)
+
+    def as_dict(self):
+        return {
+            "searches": self.searches,
+            "expansions": self.expansions,
+            "pushes": self.pushes,
+            "stale_pops": self.stale_pops,
+            "re_expansions": self.re_expansions,
+            "peak_open": self.peak_open,
+            "wall_time": self.wall_time,
+        }
+
+
 # ## Task 1: Depth-first search
 # Implement a stack-based DFS that returns a path from a start city to a goal city.
 # Tipp: elements of the stack can have the form (city, path to city)
@@ -183,39 +385,210 @@ islands_heuristic_bad = {
 # In[26]:
 
 
-def depth_first_search(graph, start, goal):
+def depth_first_search(graph, start, goal, stats=None):
     '''
     Iterative depth-first search on a weighted graph.
     graph: dict[str, list[tuple[str, int]]]
     Returns a path as a list of city names from start to goal (inclusive).
+    stats: optional SearchStats that records this search
+    '''
+    if isinstance(graph, CompiledGraph):
+        return _depth_first_search_compiled(graph, start, goal, stats)
+
+    run = stats.start("depth_first_search") if stats is not None else None
+    # Parent pointers instead of a path per stack entry, the path is only built at the goal
+    came_from = {}
+    for current_city in _depth_first_visits(graph, start, came_from, run):
+        if current_city == goal:
+            if run:
+                stats.finish(run)
+            return reconstruct_path(came_from, current_city)
+
+    if run:
+        stats.finish(run)
+    raise ValueError("No path found from {start} to {goal}")
+
+
+def _depth_first_visits(graph, start, came_from, run=None):
+    '''
+    Yields nodes in depth-first visit order, expanding neighbors in listed order.
+    Stack entries are (node, parent); came_from[node] is set when node is visited.
     '''
     visited = set()
-    stack = []
-    # TODO: seed the stack with the start node and its path
-    # Format: (current_node, path_so_far)
-    stack.append((start, [start]))
+    stack = [(start, None)]
 
     while stack:
-        # TODO: pop the next node to explore (LIFO)
-        current_city, path = stack.pop()
-
-        # TODO: check if we've reached the goal
-        if current_city == goal:
-            return path
+        current_city, parent = stack.pop()
 
-        # TODO: skip if visited, otherwise mark visited
         if current_city in visited:
+            if run:
+                run.stale_pops += 1
             continue
-        else:
-            visited.add(current_city)
+        visited.add(current_city)
+        if parent is not None:
+            came_from[current_city] = parent
+        if run:
+            run.expansions += 1
+        yield current_city
 
-        # TODO: iterate over neighbors in order and push unseen ones with their new paths
         for neighbor, distance in reversed(graph[current_city]):
             if neighbor not in visited:
-                new_path = path + [neighbor]
-                stack.append((neighbor, new_path))
+                stack.append((neighbor, current_city))
+                if run:
+                    run.push(len(stack))
+
+
+def _depth_first_visits_compiled(graph, start_id, came_from, run=None):
+    '''_depth_first_visits on a CompiledGraph with a visited bitmap and an id-indexed came_from array.'''
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.num_nodes)
+    stack = [(start_id, -1)]
+
+    while stack:
+        current, parent = stack.pop()
+
+        if visited[current]:
+            if run:
+                run.stale_pops += 1
+            continue
+        visited[current] = 1
+        came_from[current] = parent
+        if run:
+            run.expansions += 1
+        yield current
+
+        for e in range(offsets[current + 1] - 1, offsets[current] - 1, -1):
+            neighbor = targets[e]
+            if not visited[neighbor]:
+                stack.append((neighbor, current))
+                if run:
+                    run.push(len(stack))
+
+
+def _depth_first_search_compiled(graph, start, goal, stats=None):
+    '''depth_first_search on a CompiledGraph, same expansion order as on the dict map.'''
+    run = stats.start("depth_first_search") if stats is not None else None
+    start_id, goal_id = graph.index[start], graph.index[goal]
+    came_from = array('i', [-1]) * graph.num_nodes
+
+    for current in _depth_first_visits_compiled(graph, start_id, came_from, run):
+        if current == goal_id:
+            if run:
+                stats.finish(run)
+            path = [current]
+            while came_from[path[-1]] != -1:
+                path.append(came_from[path[-1]])
+            return [graph.names[node_id] for node_id in reversed(path)]
+
+    if run:
+        stats.finish(run)
+    raise ValueError(f"No path found from {start} to {goal}")
+
+
+def depth_first_order(graph, start):
+    '''
+    Generator over all nodes reachable from start in the order
+    depth_first_search visits them.
+    '''
+    if isinstance(graph, CompiledGraph):
+        came_from = array('i', [-1]) * graph.num_nodes
+        for node_id in _depth_first_visits_compiled(graph, graph.index[start], came_from):
+            yield graph.names[node_id]
+    else:
+        yield from _depth_first_visits(graph, start, {})
+
+
+# ## Indexed priority queue
+# `a_star_search` and `dijkstra` push a new heap entry whenever a node gets cheaper and skip the outdated entries when they come up (lazy deletion), so on dense graphs the heap can grow to many times the number of nodes. `IndexedHeap` keeps one entry per node and changes its priority in place (decrease-key), so it never holds more than V entries.
+# Pass `queue="indexed"` to `a_star_search`, `dijkstra` or `compute_true_costs` to use it. Pop order and results are the same as with the default `queue="lazy"`. In CPython the lazy heap is about twice as fast because `heapq` is written in C; the indexed heap is the choice when heap memory matters more (`run_benchmarks` compares both).
+# 
+
+# In[ ]:
+
+
+class _Positions(dict):
+    '''item -> heap position, -1 for items that are not in the heap.'''
+
+    def __missing__(self, item):
+        return -1
 
-    raise ValueError("No path found from {start} to {goal}")
+
+class IndexedHeap:
+    '''
+    Binary min-heap of (priority, item) pairs with at most one entry per item,
+    so priorities are changed in place (decrease-key) instead of pushing duplicates.
+    size: if given, items are the ints range(size) and positions live in a flat array
+    '''
+
+    def __init__(self, size=None):
+        self._heap = []
+        self._position = _Positions() if size is None else array('q', [-1]) * size
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+    def __contains__(self, item):
+        return self._position[item] >= 0
+
+    def peek(self):
+        '''Returns the (priority, item) pair with the lowest priority without removing it.'''
+        return self._heap[0]
+
+    def push(self, item, priority):
+        '''Inserts item or changes its priority.'''
+        heap, position = self._heap, self._position
+        i = position[item]
+        entry = (priority, item)
+        if i < 0:
+            heap.append(entry)
+            self._sift_up(len(heap) - 1, entry)
+        elif entry < heap[i]:
+            self._sift_up(i, entry)
+        else:
+            self._sift_down(i, entry)
+
+    def pop(self):
+        '''Removes and returns the (priority, item) pair with the lowest priority.'''
+        heap = self._heap
+        top = heap[0]
+        last = heap.pop()
+        if heap:
+            self._sift_down(0, last)
+        self._position[top[1]] = -1
+        return top
+
+    def _sift_up(self, i, entry):
+        heap, position = self._heap, self._position
+        while i > 0:
+            parent = (i - 1) >> 1
+            above = heap[parent]
+            if entry >= above:
+                break
+            heap[i] = above
+            position[above[1]] = i
+            i = parent
+        heap[i] = entry
+        position[entry[1]] = i
+
+    def _sift_down(self, i, entry):
+        heap, position = self._heap, self._position
+        n = len(heap)
+        child = 2 * i + 1
+        while child < n:
+            if child + 1 < n and heap[child + 1] < heap[child]:
+                child += 1
+            below = heap[child]
+            if entry <= below:
+                break
+            heap[i] = below
+            position[below[1]] = i
+            i = child
+            child = 2 * i + 1
+        heap[i] = entry
+        position[entry[1]] = i
 
 
 # ## Task 2: A* search
@@ -235,13 +608,37 @@ def reconstruct_path(came_from, current):
     return list(reversed(path))
 
 
-def a_star_search(graph, start, goal, heuristic):
+def a_star_search(graph, start, goal, heuristic, epsilon=0, stats=None, queue="lazy", workspace=None):
     '''
     A* search on a weighted graph.
     Returns (path, total_cost) where path includes start and goal.
+    epsilon > 0 runs weighted A* with f = g + (1 + epsilon) * h; with an
+    admissible heuristic the cost is at most (1 + epsilon) times optimal.
+    stats: optional SearchStats that records this search
+    queue: "lazy" (heapq with lazy deletion) or "indexed" (IndexedHeap)
+    A CertifiedHeuristic for this graph and goal selects a closed-set
+    engine that never re-opens nodes (lazy queue, epsilon=0 only).
+    workspace: optional SearchWorkspace of graph, reuses its buffers (lazy queue only)
     '''
+    if epsilon < 0:
+        raise ValueError(f"epsilon must be >= 0, got {epsilon}")
+    if workspace is not None:
+        if queue != "lazy":
+            raise ValueError("A SearchWorkspace only supports queue='lazy'")
+        return _a_star_search_workspace(graph, start, goal, heuristic, epsilon, stats, workspace)
+    if queue == "indexed":
+        return _a_star_search_indexed(graph, start, goal, heuristic, epsilon, stats)
+    if queue != "lazy":
+        raise ValueError(f"Unknown queue {queue!r}, expected 'lazy' or 'indexed'")
+    if epsilon == 0 and hasattr(heuristic, 'certifies') and heuristic.certifies(graph, goal):
+        return _a_star_search_closed(graph, start, goal, heuristic, stats)
+    if isinstance(graph, CompiledGraph):
+        return _a_star_search_compiled(graph, start, goal, heuristic, epsilon, stats)
+
+    run = stats.start("a_star_search") if stats is not None else None
+    weight = 1 + epsilon
     g_score = {start: 0}
-    f_score = {start: heuristic[start]}
+    f_score = {start: weight * heuristic[start]}
     open_set = []  # store nodes to explore
     # TODO: add the start node to open_set
     heapq.heappush(open_set, (f_score[start], start))
@@ -252,65 +649,270 @@ def a_star_search(graph, start, goal, heuristic):
         current_f_score, current = heapq.heappop(open_set)
 
         if current_f_score > f_score.get(current, float('inf')):
+            if run:
+                run.stale_pops += 1
             continue
 
         # TODO: if current is goal, reconstruct path and return (path, g_score[current])
         if current == goal:
+            if run:
+                stats.finish(run)
             final_path = reconstruct_path(came_from, current)
             return final_path, g_score[current]
 
+        if run:
+            run.expand(current)
         for neighbor, edge_cost in graph.get(current, []):
             tentative_g = g_score[current] + edge_cost
             # TODO: if this path to neighbor is better, record it and ensure neighbor is in open_set
             if tentative_g < g_score.get(neighbor, float('inf')):
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative_g
-                total_f = tentative_g + heuristic[neighbor]
+                total_f = tentative_g + weight * heuristic[neighbor]
                 f_score[neighbor] = total_f
                 heapq.heappush(open_set, (total_f, neighbor))
+                if run:
+                    run.push(len(open_set))
 
+    if run:
+        stats.finish(run)
     raise ValueError("No path found from {start} to {goal}")
 
 
-# ## Task 3: Check heuristic admissibility/consistency
-# Compute true costs (e.g., Dijkstra from the goal) and report if a heuristic is admissible and consistent.
+def _a_star_search_compiled(graph, start, goal, heuristic, epsilon=0, stats=None):
+    '''a_star_search on a CompiledGraph, node ids instead of names in all inner loops.'''
+    run = stats.start("a_star_search") if stats is not None else None
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    h = _heuristic_lookup(graph, heuristic)
+    weight = 1 + epsilon
+    start_id, goal_id = graph.index[start], graph.index[goal]
+
+    g_score = {start_id: 0}
+    f_score = {start_id: weight * h(start_id)}
+    open_set = [(f_score[start_id], start_id)]
+    came_from = {}
+
+    while open_set:
+        current_f_score, current = heapq.heappop(open_set)
+
+        if current_f_score > f_score.get(current, float('inf')):
+            if run:
+                run.stale_pops += 1
+            continue
+
+        if current == goal_id:
+            if run:
+                stats.finish(run)
+            path = reconstruct_path(came_from, current)
+            return [graph.names[node_id] for node_id in path], g_score[current]
+
+        if run:
+            run.expand(current)
+        g_current = g_score[current]
+        for e in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[e]
+            tentative_g = g_current + weights[e]
+            if tentative_g < g_score.get(neighbor, float('inf')):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                total_f = tentative_g + weight * h(neighbor)
+                f_score[neighbor] = total_f
+                heapq.heappush(open_set, (total_f, neighbor))
+                if run:
+                    run.push(len(open_set))
+
+    if run:
+        stats.finish(run)
+    raise ValueError(f"No path found from {start} to {goal}")
+
+
+def _a_star_search_indexed(graph, start, goal, heuristic, epsilon=0, stats=None):
+    '''a_star_search with an IndexedHeap, works on dict maps and CompiledGraphs.'''
+    run = stats.start("a_star_search") if stats is not None else None
+    weight = 1 + epsilon
+    compiled = isinstance(graph, CompiledGraph)
+    if compiled:
+        neighbors, h = graph.edges, _heuristic_lookup(graph, heuristic)
+        source, target = graph.index[start], graph.index[goal]
+    else:
+        neighbors, h = (lambda node: graph.get(node, [])), heuristic.__getitem__
+        source, target = start, goal
+    # positions in a dict: A* usually reaches only a small part of the graph
+    open_set = IndexedHeap()
+
+    g_score = {source: 0}
+    came_from = {}
+    open_set.push(source, weight * h(source))
+
+    while open_set:
+        _, current = open_set.pop()
+
+        if current == target:
+            if run:
+                stats.finish(run)
+            path = reconstruct_path(came_from, current)
+            if compiled:
+                path = [graph.names[node_id] for node_id in path]
+            return path, g_score[current]
+
+        if run:
+            run.expand(current)
+        g_current = g_score[current]
+        for neighbor, edge_cost in neighbors(current):
+            tentative_g = g_current + edge_cost
+            if tentative_g < g_score.get(neighbor, float('inf')):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                open_set.push(neighbor, tentative_g + weight * h(neighbor))
+                if run:
+                    run.push(len(open_set))
+
+    if run:
+        stats.finish(run)
+    raise ValueError(f"No path found from {start} to {goal}")
+
+
+# ## Dijkstra engine
+# Priority-queue Dijkstra on a `CompiledGraph` (dict maps are compiled on the fly). It runs from one or several sources, can stop at a cost radius and returns a dense cost array indexed by node id.
 # 
 
-# In[28]:
+# In[ ]:
 
 
-def compute_true_costs(graph, goal):
-    '''Compute shortest-path cost from every node to goal (e.g., Dijkstra).'''
-    # TODO: implement Dijkstra (or another shortest-path algorithm) from goal
+def as_compiled(graph):
+    '''Returns graph as a CompiledGraph, compiling dict maps.'''
+    if isinstance(graph, CompiledGraph):
+        return graph
+    return CompiledGraph.from_map(graph)
+
+
+def _dijkstra_ids(graph, source_ids, radius=None, parents=None, stop_at=None, run=None, queue="lazy"):
+    '''
+    Dijkstra on a CompiledGraph from the given source ids.
+    Returns an array of costs indexed by node id; nodes that are unreachable
+    or farther away than radius keep float('inf').
+    parents: optional id-indexed array that receives the shortest-path tree
+    stop_at: optional set of ids, the search ends once all of them are settled
+    run:     optional _SearchRun that counts the work
+    queue:   "lazy" (heapq with lazy deletion) or "indexed" (IndexedHeap)
+    '''
+    if queue == "indexed":
+        return _dijkstra_ids_indexed(graph, source_ids, radius, parents, stop_at, run)
+    if queue != "lazy":
+        raise ValueError(f"Unknown queue {queue!r}, expected 'lazy' or 'indexed'")
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    costs = array('d', [float('inf')]) * graph.num_nodes
     queue = []
-    queue.append(goal)
+    for source in source_ids:
+        costs[source] = 0
+        queue.append((0, source))
+    heapq.heapify(queue)
+    limit = float('inf') if radius is None else radius
+    remaining = set(stop_at) if stop_at is not None else None
 
-    visited = set()
-    costs = {}
+    while queue:
+        cost, node = heapq.heappop(queue)
+        if cost > costs[node]:
+            if run:
+                run.stale_pops += 1
+            continue
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+        if run:
+            run.expansions += 1
+        for e in range(offsets[node], offsets[node + 1]):
+            j = targets[e]
+            new_cost = cost + weights[e]
+            if new_cost < costs[j] and new_cost <= limit:
+                costs[j] = new_cost
+                if parents is not None:
+                    parents[j] = node
+                heapq.heappush(queue, (new_cost, j))
+                if run:
+                    run.push(len(queue))
 
-    for node in graph:
-        costs[node] = float('inf')
+    return costs
 
-    costs[goal] = 0
+
+def _dijkstra_ids_indexed(graph, source_ids, radius=None, parents=None, stop_at=None, run=None):
+    '''_dijkstra_ids with an IndexedHeap, at most one queue entry per node.'''
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    costs = array('d', [float('inf')]) * graph.num_nodes
+    queue = IndexedHeap(graph.num_nodes)
+    for source in source_ids:
+        costs[source] = 0
+        queue.push(source, 0)
+    limit = float('inf') if radius is None else radius
+    remaining = set(stop_at) if stop_at is not None else None
 
     while queue:
-        node = min(queue, key=lambda x: costs[x])
-        queue.remove(node)
-        visited.add(node)
-        # TODO berechne neue Kosten für alle Nachfolger j von k die nicht Element von E sind
-        for j, dist in graph[node]:
-            if j not in visited:
-                new_cost = costs[node] + dist
+        cost, node = queue.pop()
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+        if run:
+            run.expansions += 1
+        for e in range(offsets[node], offsets[node + 1]):
+            j = targets[e]
+            new_cost = cost + weights[e]
+            if new_cost < costs[j] and new_cost <= limit:
+                costs[j] = new_cost
+                if parents is not None:
+                    parents[j] = node
+                queue.push(j, new_cost)
+                if run:
+                    run.push(len(queue))
 
-                if new_cost < costs[j]:
-                    costs[j] = new_cost
+    return costs
 
-                    if j not in queue:
-                        queue.append(j)
 
-    return costs
+def dijkstra(graph, sources, radius=None, stats=None, queue="lazy"):
+    '''
+    Shortest-path costs from sources to every node.
+    sources: a single node name or an iterable of node names (multi-source run)
+    radius:  optional bound, nodes farther away stay at float('inf')
+    stats:   optional SearchStats that records this search
+    queue:   "lazy" (heapq with lazy deletion) or "indexed" (IndexedHeap)
+    Returns (compiled_graph, costs) where costs is indexed by compiled_graph ids.
+    '''
+    graph = as_compiled(graph)
+    if isinstance(sources, str):
+        sources = [sources]
+    source_ids = [graph.index[source] for source in sources]
+    run = stats.start("dijkstra") if stats is not None else None
+    costs = _dijkstra_ids(graph, source_ids, radius, run=run, queue=queue)
+    if run:
+        stats.finish(run)
+    return graph, costs
+
+
+# ## Task 3: Check heuristic admissibility/consistency
+# Compute true costs (e.g., Dijkstra from the goal) and report if a heuristic is admissible and consistent.
+# 
+
+# In[28]:
+
+
+def compute_true_costs(graph, goal, stats=None, queue="lazy"):
+    '''Compute shortest-path cost from every node to goal (e.g., Dijkstra).'''
+    # The maps are bidirectional, so costs from goal equal costs to goal.
+    compiled, costs = dijkstra(graph, [goal], stats=stats, queue=queue)
     # Return a dict {node: cost_to_goal}
-    raise NotImplementedError("Compute true costs to the goal")
+    return dict(zip(compiled.names, costs))
+
+
+def _heuristic_array(graph, heuristic):
+    '''Heuristic as an id-indexed sequence, a dict must cover every node.'''
+    if isinstance(heuristic, dict):
+        return array('d', (heuristic[name] for name in graph.names))
+    if hasattr(heuristic, 'array'):
+        return heuristic.array(graph)
+    if hasattr(heuristic, 'lookup'):
+        return array('d', map(heuristic.lookup(graph), range(graph.num_nodes)))
+    return heuristic
 
 
 def check_heuristic(graph, heuristic, goal):
@@ -318,26 +920,2835 @@ def check_heuristic(graph, heuristic, goal):
     Returns (admissible, consistent) for the given heuristic.
     Automatically uses computed true costs; no external input needed.
     '''
-    true_costs = compute_true_costs(graph, goal)
-    admissible = True 
-    consistent = True 
-
-    if heuristic.get(goal, None) != 0:
-        consistent = False
+    graph, true_costs = dijkstra(graph, [goal])
+    h = _heuristic_array(graph, heuristic)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    admissible = True
+    consistent = h[graph.index[goal]] == 0
 
-    for node, neighbors in graph.items():
-        h_node = heuristic[node]
+    for node in range(graph.num_nodes):
+        h_node = h[node]
 
-        if h_node > true_costs.get(node, float('inf')):
+        if h_node > true_costs[node]:
             admissible = False
 
-        for neighbor, cost in neighbors:
-            if h_node > cost + heuristic[neighbor]:
-               consistent = False
+        for e in range(offsets[node], offsets[node + 1]):
+            if h_node > weights[e] + h[targets[e]]:
+                consistent = False
 
     return admissible, consistent
 
 
+# ## Bidirectional A*
+# Grows a forward frontier from the start and a backward frontier from the goal on the same bidirectional map and returns `(path, cost)` like `a_star_search`.
+# The search stops as soon as the smallest f-score of one frontier is at least the cost of the best meeting found so far, so the result stays optimal for admissible heuristics.
+# 
+
+# In[ ]:
+
+
+def bidirectional_a_star_search(graph, start, goal, heuristic, reverse_heuristic=None):
+    '''
+    Bidirectional A* on a bidirectional weighted graph.
+    heuristic:         estimates to goal, guides the forward frontier
+    reverse_heuristic: estimates to start, guides the backward frontier
+                       (None means 0 everywhere, a plain Dijkstra frontier)
+    Returns (path, total_cost) where path includes start and goal.
+    '''
+    if start == goal:
+        return [start], 0
+
+    h_forward = heuristic.__getitem__
+    h_backward = reverse_heuristic.__getitem__ if reverse_heuristic is not None else (lambda node: 0)
+
+    # g_score, f_score, came_from and open_set per direction
+    forward = ({start: 0}, {start: h_forward(start)}, {}, [(h_forward(start), start)])
+    backward = ({goal: 0}, {goal: h_backward(goal)}, {}, [(h_backward(goal), goal)])
+    best_cost = float('inf')
+    meeting = None
+
+    while True:
+        for _, f_score, _, open_set in (forward, backward):
+            while open_set and open_set[0][0] > f_score.get(open_set[0][1], float('inf')):
+                heapq.heappop(open_set)
+        if not forward[3] or not backward[3]:
+            break
+        # every shorter path would still have a node on both frontiers with f < best_cost
+        if forward[3][0][0] >= best_cost or backward[3][0][0] >= best_cost:
+            break
+
+        if len(forward[3]) <= len(backward[3]):
+            (g_score, f_score, came_from, open_set), other_g, h = forward, backward[0], h_forward
+        else:
+            (g_score, f_score, came_from, open_set), other_g, h = backward, forward[0], h_backward
+
+        _, current = heapq.heappop(open_set)
+        for neighbor, edge_cost in graph.get(current, []):
+            tentative_g = g_score[current] + edge_cost
+            if tentative_g < g_score.get(neighbor, float('inf')):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                total_f = tentative_g + h(neighbor)
+                f_score[neighbor] = total_f
+                heapq.heappush(open_set, (total_f, neighbor))
+                if neighbor in other_g and tentative_g + other_g[neighbor] < best_cost:
+                    best_cost = tentative_g + other_g[neighbor]
+                    meeting = neighbor
+
+    if meeting is None:
+        raise ValueError(f"No path found from {start} to {goal}")
+
+    path = reconstruct_path(forward[2], meeting)
+    current = meeting
+    while current in backward[2]:
+        current = backward[2][current]
+        path.append(current)
+    return path, best_cost
+
+
+# ## ALT landmark heuristics
+# Instead of a hand-written straight-line table per goal, `LandmarkIndex` picks `k` landmarks by farthest-point selection and stores one Dijkstra cost row per landmark in a flat array.
+# By the triangle inequality `|d(L, goal) - d(L, v)|` never overestimates `d(v, goal)`, so the maximum over all landmarks is an admissible (and consistent) heuristic for any goal.
+# The heuristic objects work with `a_star_search` and `check_heuristic` on dict maps and compiled graphs.
+# 
+
+# In[ ]:
+
+
+class LandmarkIndex:
+    '''
+    Landmark distance tables for ALT heuristics on a bidirectional graph.
+    table[i * V + v] is the cost between landmark i and node id v.
+    '''
+
+    def __init__(self, graph, landmarks, table):
+        self.graph = graph
+        self.landmarks = landmarks
+        self.table = table
+
+    @classmethod
+    def build(cls, graph, k=4, seed=None):
+        '''
+        Picks k landmarks by farthest-point selection and runs one Dijkstra per landmark.
+        seed: node name the selection starts from (default: first node id)
+        '''
+        graph = as_compiled(graph)
+        num_nodes = graph.num_nodes
+        seed_id = graph.index[seed] if seed is not None else 0
+        # distance of every node to the closest landmark picked so far
+        closest = _dijkstra_ids(graph, [seed_id])
+        landmarks = []
+        table = array('d')
+
+        for _ in range(min(k, num_nodes)):
+            candidates = [v for v in range(num_nodes) if closest[v] < float('inf') and v not in landmarks]
+            if not candidates:
+                break
+            landmark = max(candidates, key=closest.__getitem__)
+            row = _dijkstra_ids(graph, [landmark])
+            landmarks.append(landmark)
+            table.extend(row)
+            for v in range(num_nodes):
+                if row[v] < closest[v]:
+                    closest[v] = row[v]
+
+        return cls(graph, landmarks, table)
+
+    @property
+    def landmark_names(self):
+        return [self.graph.names[landmark] for landmark in self.landmarks]
+
+    def lower_bound(self, u, v):
+        '''Admissible estimate of the cost between node ids u and v.'''
+        num_nodes = self.graph.num_nodes
+        table = self.table
+        best = 0
+        for i in range(len(self.landmarks)):
+            du = table[i * num_nodes + u]
+            dv = table[i * num_nodes + v]
+            # nodes in another component than the landmark carry no information
+            if du < float('inf') and dv < float('inf'):
+                best = max(best, abs(du - dv))
+        return best
+
+    def heuristic(self, goal):
+        '''ALT heuristic towards goal, usable wherever a heuristic dict is accepted.'''
+        return ALTHeuristic(self, goal)
+
+
+class ALTHeuristic:
+    '''Lazy ALT heuristic towards one goal, nothing is stored per node.'''
+
+    def __init__(self, landmark_index, goal):
+        self.landmark_index = landmark_index
+        self.goal = goal
+        self.goal_id = landmark_index.graph.index[goal]
+
+    def __getitem__(self, node):
+        index = self.landmark_index
+        return index.lower_bound(index.graph.index[node], self.goal_id)
+
+    def get(self, node, default=None):
+        if node not in self.landmark_index.graph.index:
+            return default
+        return self[node]
+
+    def lookup(self, graph):
+        '''Returns a function node_id -> estimate for ids of graph.'''
+        index = self.landmark_index
+        if graph is index.graph:
+            return lambda node_id: index.lower_bound(node_id, self.goal_id)
+        names = graph.names
+        return lambda node_id: self[names[node_id]]
+
+
+# ## Contraction hierarchies
+# For many point-to-point queries on a static map, `ContractionHierarchy.build` contracts the nodes one by one (cheapest edge difference first) and inserts a shortcut `u -> w` over a contracted node `v` whenever no witness path avoiding `v` is as short.
+# A query is a bidirectional Dijkstra that only walks upwards in the contraction order; shortcuts are unpacked afterwards so `query` returns `(path, cost)` like `a_star_search`.
+# Hierarchies can be written to and read from JSON with `save` and `load`.
+# 
+
+# In[ ]:
+
+
+import json
+
+
+def _csr_from_lists(adjacency):
+    '''CSR arrays (offsets, targets, weights) from a list of [(target_id, weight), ...].'''
+    offsets = array('q', [0])
+    targets = array('i')
+    weights = array('d')
+    for edges in adjacency:
+        for target, weight in edges:
+            targets.append(target)
+            weights.append(weight)
+        offsets.append(len(targets))
+    return offsets, targets, weights
+
+
+_CH_ESTIMATE_SETTLED = 50  # settled nodes per witness search when estimating priorities
+_CH_ESTIMATE_DEGREE = 8    # neighbors up to this degree are re-estimated after a contraction
+
+
+def _witness_costs(out_edges, source, skip, limits, max_hops, max_settled):
+    '''
+    Local Dijkstra from source that avoids skip. limits maps every target to the
+    largest cost a witness path to it may have; the search stops once no
+    unsettled target can still get one or after max_settled nodes, and with
+    max_hops it does not extend paths beyond that many edges.
+    '''
+    pending = sorted(limits, key=limits.get)  # unsettled targets, the one with the largest limit last
+    max_cost = limits[pending[-1]]
+    costs = {source: 0}
+    hops = {source: 0} if max_hops is not None else None
+    queue = [(0, source)]
+    settled = 0
+    pop, push, inf = heapq.heappop, heapq.heappush, float('inf')
+    while queue:
+        cost, node = pop(queue)
+        if cost > costs[node]:
+            continue
+        if cost > max_cost or settled == max_settled:
+            break
+        settled += 1
+        if node in limits:
+            limits = {w: limit for w, limit in limits.items() if w != node}
+            while pending and pending[-1] not in limits:
+                pending.pop()
+            if not pending:
+                break
+            max_cost = limits[pending[-1]]
+        if hops is not None:
+            if hops[node] == max_hops:
+                continue
+            next_hops = hops[node] + 1
+        for neighbor, edge_cost in out_edges[node].items():
+            new_cost = cost + edge_cost
+            if new_cost <= max_cost and new_cost < costs.get(neighbor, inf) and neighbor != skip:
+                costs[neighbor] = new_cost
+                if hops is not None:
+                    hops[neighbor] = next_hops
+                push(queue, (new_cost, neighbor))
+    return costs
+
+
+def _needed_shortcuts(out_edges, in_edges, v, max_hops, max_settled, symmetric=False):
+    '''
+    Shortcuts (u, w, cost) that keep all distances intact when v is removed.
+    symmetric: every edge exists in both directions with the same cost, so
+               only u < w is searched and both directions are returned
+    '''
+    shortcuts = []
+    for u, cost_uv in in_edges[v].items():
+        limits = {w: cost_uv + cost_vw for w, cost_vw in out_edges[v].items() if (w > u if symmetric else w != u)}
+        if not limits:
+            continue
+        witness = _witness_costs(out_edges, u, v, limits, max_hops, max_settled)
+        for w, cost in limits.items():
+            if witness.get(w, float('inf')) > cost:
+                shortcuts.append((u, w, cost))
+                if symmetric:
+                    shortcuts.append((w, u, cost))
+    return shortcuts
+
+
+class ContractionHierarchy:
+    '''
+    Contraction hierarchy over a compiled graph.
+    rank:   rank[v] is the position of node id v in the contraction order
+    up:     CSR of edges v -> w with rank[w] > rank[v] (forward search)
+    down:   CSR of reversed edges, v -> u for every edge u -> v with rank[u] > rank[v] (backward search)
+    middle: dict (u, w) -> contracted node id for every shortcut u -> w
+    '''
+
+    def __init__(self, names, rank, up, down, middle):
+        self.names = names
+        self.index = {name: node_id for node_id, name in enumerate(names)}
+        self.rank = rank
+        self.up = up
+        self.down = down
+        self.middle = middle
+        self.last_expansions = 0
+
+    @classmethod
+    def build(cls, graph, max_hops=None, max_settled=300):
+        '''
+        Contracts all nodes of graph (dict map or CompiledGraph).
+        max_hops, max_settled bound every witness search; smaller values build
+        faster but add more shortcuts.
+        '''
+        graph = as_compiled(graph)
+        num_nodes = graph.num_nodes
+        out_edges = [{} for _ in range(num_nodes)]
+        in_edges = [{} for _ in range(num_nodes)]
+        for u in range(num_nodes):
+            for w, cost in graph.edges(u):
+                if w != u and cost < out_edges[u].get(w, float('inf')):
+                    out_edges[u][w] = cost
+                    in_edges[w][u] = cost
+        symmetric = out_edges == in_edges
+
+        deleted_neighbors = [0] * num_nodes
+        level = [0] * num_nodes  # length of the longest chain of contracted nodes below v
+        estimated = [0] * num_nodes  # shortcut count of the last estimate
+
+        def estimate(v):
+            # cheaper witness searches, only used to order the nodes
+            estimated[v] = len(_needed_shortcuts(out_edges, in_edges, v, max_hops,
+                                                 _CH_ESTIMATE_SETTLED, symmetric))
+
+        def priority(v):
+            edge_difference = estimated[v] - len(out_edges[v]) - len(in_edges[v])
+            return edge_difference + deleted_neighbors[v] + level[v]
+
+        for v in range(num_nodes):
+            estimate(v)
+        priorities = [priority(v) for v in range(num_nodes)]
+        queue = [(p, v) for v, p in enumerate(priorities)]
+        heapq.heapify(queue)
+        contracted = [False] * num_nodes
+        rank = array('i', [0]) * num_nodes
+        up = [[] for _ in range(num_nodes)]
+        down = [[] for _ in range(num_nodes)]
+        middle = {}
+        order = 0
+
+        while queue:
+            key, v = heapq.heappop(queue)
+            if contracted[v] or key != priorities[v]:
+                continue
+            # lazy update: contract v only if it is still the cheapest node
+            shortcuts = _needed_shortcuts(out_edges, in_edges, v, max_hops, max_settled, symmetric)
+            estimated[v] = len(shortcuts)
+            priorities[v] = priority(v)
+            if queue and priorities[v] > queue[0][0]:
+                heapq.heappush(queue, (priorities[v], v))
+                continue
+
+            contracted[v] = True
+            rank[v] = order
+            order += 1
+            up[v] = list(out_edges[v].items())
+            down[v] = list(in_edges[v].items())
+
+            for u, w, cost in shortcuts:
+                if cost < out_edges[u].get(w, float('inf')):
+                    out_edges[u][w] = cost
+                    in_edges[w][u] = cost
+                    middle[(u, w)] = v
+            neighbors = set(in_edges[v]) | set(out_edges[v])
+            for u in in_edges[v]:
+                del out_edges[u][v]
+            for w in out_edges[v]:
+                del in_edges[w][v]
+            out_edges[v] = {}
+            in_edges[v] = {}
+            # the neighbors lost an edge and may need new shortcuts, re-evaluate them now;
+            # high-degree nodes keep their last shortcut count until they are popped, on
+            # hub-heavy maps re-estimating them after every contracted neighbor is too slow
+            for u in neighbors:
+                deleted_neighbors[u] += 1
+                level[u] = max(level[u], level[v] + 1)
+                if len(in_edges[u]) <= _CH_ESTIMATE_DEGREE:
+                    estimate(u)
+                priorities[u] = priority(u)
+                heapq.heappush(queue, (priorities[u], u))
+
+        return cls(graph.names, rank, _csr_from_lists(up), _csr_from_lists(down), middle)
+
+    @property
+    def num_shortcuts(self):
+        return len(self.middle)
+
+    def _unpack(self, path):
+        '''Replaces every shortcut in a node id path by the nodes it skips.'''
+        unpacked = [path[0]]
+        for u, w in zip(path, path[1:]):
+            stack = [(u, w)]
+            while stack:
+                a, b = stack.pop()
+                m = self.middle.get((a, b))
+                if m is None:
+                    unpacked.append(b)
+                else:
+                    stack.append((m, b))
+                    stack.append((a, m))
+        return unpacked
+
+    def query(self, start, goal):
+        '''
+        Shortest path from start to goal.
+        Returns (path, total_cost) where path includes start and goal.
+        '''
+        s, t = self.index[start], self.index[goal]
+        if s == t:
+            return [start], 0
+
+        # cost, came_from, open_set, CSR arrays to search and CSR arrays to stall per direction
+        forward = ({s: 0}, {}, [(0, s)], self.up, self.down)
+        backward = ({t: 0}, {}, [(0, t)], self.down, self.up)
+        inf = best_cost = float('inf')
+        meeting = None
+        expansions = 0
+
+        while forward[2] or backward[2]:
+            top_forward = forward[2][0][0] if forward[2] else float('inf')
+            top_backward = backward[2][0][0] if backward[2] else float('inf')
+            if min(top_forward, top_backward) >= best_cost:
+                break
+            if top_forward <= top_backward:
+                (costs, came_from, open_set, (offsets, targets, weights), stall), other = forward, backward[0]
+            else:
+                (costs, came_from, open_set, (offsets, targets, weights), stall), other = backward, forward[0]
+
+            cost, node = heapq.heappop(open_set)
+            if cost > costs[node]:
+                continue
+            expansions += 1
+            # stall-on-demand: a higher node already reaches this one more cheaply,
+            # so its cost is not final and expanding it cannot lead to the shortest path
+            stall_offsets, stall_targets, stall_weights = stall
+            stalled = False
+            for e in range(stall_offsets[node], stall_offsets[node + 1]):
+                if costs.get(stall_targets[e], inf) + stall_weights[e] < cost:
+                    stalled = True
+                    break
+            if stalled:
+                continue
+            for e in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[e]
+                new_cost = cost + weights[e]
+                if new_cost < costs.get(neighbor, inf):
+                    costs[neighbor] = new_cost
+                    came_from[neighbor] = node
+                    heapq.heappush(open_set, (new_cost, neighbor))
+                    if neighbor in other and new_cost + other[neighbor] < best_cost:
+                        best_cost = new_cost + other[neighbor]
+                        meeting = neighbor
+
+        self.last_expansions = expansions
+        if meeting is None:
+            raise ValueError(f"No path found from {start} to {goal}")
+
+        path = reconstruct_path(forward[1], meeting)
+        current = meeting
+        while current in backward[1]:
+            current = backward[1][current]
+            path.append(current)
+        return [self.names[node_id] for node_id in self._unpack(path)], best_cost
+
+    def save(self, path):
+        '''Writes the hierarchy to a JSON file.'''
+        data = {
+            "names": self.names,
+            "rank": self.rank.tolist(),
+            "up": [part.tolist() for part in self.up],
+            "down": [part.tolist() for part in self.down],
+            "shortcuts": [[u, w, m] for (u, w), m in self.middle.items()],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path):
+        '''Reads a hierarchy written by save.'''
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        up = tuple(array(code, part) for code, part in zip('qid', data["up"]))
+        down = tuple(array(code, part) for code, part in zip('qid', data["down"]))
+        middle = {(u, w): m for u, w, m in data["shortcuts"]}
+        return cls(data["names"], array('i', data["rank"]), up, down, middle)
+
+
+# ## Distance matrix
+# `distance_matrix` answers all origin x destination pairs with one shared Dijkstra tree per distinct source instead of one `a_star_search` per pair. Each tree stops as soon as every target is settled.
+# 
+
+# In[ ]:
+
+
+import numpy as np
+
+
+def distance_matrix(graph, sources, targets, return_paths=False):
+    '''
+    Shortest-path costs between every source and every target.
+    Returns a NumPy array of shape (len(sources), len(targets)) with
+    float('inf') for unreachable pairs. With return_paths=True also returns
+    paths[i][j], the list of node names from sources[i] to targets[j]
+    (None if unreachable).
+    '''
+    graph = as_compiled(graph)
+    target_ids = [graph.index[target] for target in targets]
+    matrix = np.full((len(sources), len(targets)), np.inf)
+    paths = [[None] * len(targets) for _ in sources] if return_paths else None
+    rows = {}  # source id -> row already computed, repeated sources share a tree
+
+    for i, source in enumerate(sources):
+        source_id = graph.index[source]
+        if source_id in rows:
+            matrix[i] = matrix[rows[source_id]]
+            if return_paths:
+                paths[i] = list(paths[rows[source_id]])
+            continue
+        rows[source_id] = i
+
+        parents = array('i', [-1]) * graph.num_nodes if return_paths else None
+        costs = _dijkstra_ids(graph, [source_id], parents=parents, stop_at=target_ids)
+        matrix[i] = [costs[target_id] for target_id in target_ids]
+
+        if return_paths:
+            for j, target_id in enumerate(target_ids):
+                if costs[target_id] == float('inf'):
+                    continue
+                path = [target_id]
+                while path[-1] != source_id:
+                    path.append(parents[path[-1]])
+                paths[i][j] = [graph.names[node_id] for node_id in reversed(path)]
+
+    if return_paths:
+        return matrix, paths
+    return matrix
+
+
+# ## Route cache
+# `RouteCache` sits in front of `a_star_search` and `depth_first_search` and keeps the most recently used results up to `maxsize`, counting hits, misses and evictions.
+# Maps that change at runtime should be wrapped in a `VersionedMap`; every mutation through its methods (`set_edge`, `remove_edge` and the usual dict methods) drops the cached routes of that map automatically. Plain dicts and compiled graphs are assumed not to change.
+# 
+
+# In[ ]:
+
+
+import weakref
+from collections import OrderedDict
+
+
+class VersionedMap(dict):
+    '''
+    dict map that counts its mutations in version and notifies the route
+    caches that hold results for it. Edit neighbor lists through set_edge
+    and remove_edge, in-place list edits are not seen.
+    '''
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+        self._caches = weakref.WeakSet()
+
+    def _mutated(self):
+        self.version += 1
+        for cache in list(self._caches):
+            cache.invalidate(self)
+
+    def set_edge(self, u, v, cost):
+        '''Sets the cost of edge u -> v, adding it if missing (neighbor order is kept).'''
+        # copy the list, it may be shared with the map this one was built from
+        neighbors = list(self.get(u, []))
+        for i, (neighbor, _) in enumerate(neighbors):
+            if neighbor == v:
+                neighbors[i] = (v, cost)
+                break
+        else:
+            neighbors.append((v, cost))
+        super().__setitem__(u, neighbors)
+        self._mutated()
+
+    def remove_edge(self, u, v):
+        '''Removes edge u -> v.'''
+        super().__setitem__(u, [(neighbor, cost) for neighbor, cost in self[u] if neighbor != v])
+        self._mutated()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._mutated()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._mutated()
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._mutated()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._mutated()
+        return result
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._mutated()
+
+    def clear(self):
+        super().clear()
+        self._mutated()
+
+
+class RouteCache:
+    '''
+    Bounded LRU cache for search results.
+    Keys are (search, graph, start, goal, heuristic) where graph and heuristic
+    are compared by identity; entries keep references to both.
+    '''
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()  # key -> (graph, heuristic, result)
+        self._keys_by_graph = {}  # id(graph) -> set of keys
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+        }
+
+    def _cached(self, search, graph, start, goal, heuristic, compute):
+        key = (search, id(graph), start, goal, id(heuristic))
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is graph and entry[1] is heuristic:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[2]
+
+        self.misses += 1
+        result = compute()
+        self._entries[key] = (graph, heuristic, result)
+        self._keys_by_graph.setdefault(id(graph), set()).add(key)
+        if isinstance(graph, VersionedMap):
+            graph._caches.add(self)
+        while len(self._entries) > self.maxsize:
+            old_key, _ = self._entries.popitem(last=False)
+            self._forget(old_key)
+            self.evictions += 1
+        return result
+
+    def _forget(self, key):
+        keys = self._keys_by_graph.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_graph[key[1]]
+
+    def a_star_search(self, graph, start, goal, heuristic, epsilon=0):
+        '''Cached a_star_search, returns (path, total_cost).'''
+        path, cost = self._cached(("a_star", epsilon), graph, start, goal, heuristic,
+                                  lambda: a_star_search(graph, start, goal, heuristic, epsilon))
+        return list(path), cost
+
+    def depth_first_search(self, graph, start, goal):
+        '''Cached depth_first_search, returns the path.'''
+        return list(self._cached("dfs", graph, start, goal, None,
+                                 lambda: depth_first_search(graph, start, goal)))
+
+    def invalidate(self, graph=None):
+        '''Drops all cached routes of graph, or everything if graph is None.'''
+        if graph is None:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._keys_by_graph.clear()
+            return
+        for key in self._keys_by_graph.pop(id(graph), ()):
+            del self._entries[key]
+            self.invalidations += 1
+
+
+# ## Incremental replanning (LPA*)
+# `IncrementalPlanner` is seeded like `a_star_search` with `(graph, start, goal, heuristic)`. After `update_edge(u, v, w)` calls the next `plan()` repairs the previous solution (Lifelong Planning A*) and only re-expands nodes whose cost actually changed. `w = float('inf')` removes an edge; on the bidirectional maps update both directions.
+# The planner keeps its own copy of the edges, the map passed in is not modified. The heuristic should be consistent.
+# 
+
+# In[ ]:
+
+
+class IncrementalPlanner:
+    '''
+    Lifelong Planning A* between a fixed start and goal.
+    g:   current cost estimate of every node
+    rhs: one-step lookahead, min over predecessors p of g[p] + cost(p, node)
+    A node is locally inconsistent (and queued) while g != rhs.
+    '''
+
+    def __init__(self, graph, start, goal, heuristic):
+        self.start = start
+        self.goal = goal
+        self.heuristic = heuristic
+        self.successors = {}
+        self.predecessors = {}
+        for node, neighbors in graph.items():
+            self.successors.setdefault(node, {})
+            self.predecessors.setdefault(node, {})
+            for neighbor, cost in neighbors:
+                if cost < self.successors[node].get(neighbor, float('inf')):
+                    self.successors[node][neighbor] = cost
+                    self.predecessors.setdefault(neighbor, {})[node] = cost
+                    self.successors.setdefault(neighbor, {})
+        self.g = {}
+        self.rhs = {start: 0}
+        self.open_set = []  # heap of (key, node), entries not matching queued_keys are stale
+        self.queued_keys = {}
+        self.last_expansions = 0
+        self._queue(start)
+
+    def _key(self, node):
+        best = min(self.g.get(node, float('inf')), self.rhs.get(node, float('inf')))
+        return (best + self.heuristic[node], best)
+
+    def _queue(self, node):
+        key = self._key(node)
+        self.queued_keys[node] = key
+        heapq.heappush(self.open_set, (key, node))
+
+    def _update_node(self, node):
+        if node != self.start:
+            self.rhs[node] = min((self.g.get(p, float('inf')) + cost
+                                  for p, cost in self.predecessors[node].items()), default=float('inf'))
+        self.queued_keys.pop(node, None)
+        if self.g.get(node, float('inf')) != self.rhs.get(node, float('inf')):
+            self._queue(node)
+
+    def _top_key(self):
+        while self.open_set and self.queued_keys.get(self.open_set[0][1]) != self.open_set[0][0]:
+            heapq.heappop(self.open_set)
+        return self.open_set[0][0] if self.open_set else (float('inf'), float('inf'))
+
+    def _compute_shortest_path(self):
+        expansions = 0
+        goal = self.goal
+        while (self._top_key() < self._key(goal)
+               or self.rhs.get(goal, float('inf')) != self.g.get(goal, float('inf'))):
+            if not self.open_set:
+                break
+            old_key, node = heapq.heappop(self.open_set)
+            new_key = self._key(node)
+            if old_key < new_key:
+                self._queue(node)
+                continue
+            del self.queued_keys[node]
+            expansions += 1
+            if self.g.get(node, float('inf')) > self.rhs[node]:
+                self.g[node] = self.rhs[node]
+            else:
+                self.g[node] = float('inf')
+                self._update_node(node)
+            for successor in self.successors[node]:
+                self._update_node(successor)
+        self.last_expansions = expansions
+
+    def plan(self):
+        '''
+        Repairs the search after edge updates.
+        Returns (path, total_cost) where path includes start and goal.
+        '''
+        self._compute_shortest_path()
+        cost = self.g.get(self.goal, float('inf'))
+        if cost == float('inf'):
+            raise ValueError(f"No path found from {self.start} to {self.goal}")
+
+        path = [self.goal]
+        visited = {self.goal}
+        while path[-1] != self.start:
+            node = path[-1]
+            previous = min(self.predecessors[node],
+                           key=lambda p: self.g.get(p, float('inf')) + self.predecessors[node][p])
+            if previous in visited:
+                # g-values left inconsistent, e.g. by an inconsistent heuristic after weight decreases
+                raise ValueError(f"Path from {self.start} to {self.goal} loops at {previous}")
+            visited.add(previous)
+            path.append(previous)
+        return list(reversed(path)), cost
+
+    def update_edge(self, u, v, w):
+        '''Sets the cost of edge u -> v to w (float('inf') removes it).'''
+        self.successors.setdefault(u, {})
+        self.successors.setdefault(v, {})
+        self.predecessors.setdefault(u, {})
+        if w == float('inf'):
+            self.successors[u].pop(v, None)
+            self.predecessors.setdefault(v, {}).pop(u, None)
+        else:
+            self.successors[u][v] = w
+            self.predecessors.setdefault(v, {})[u] = w
+        self._update_node(v)
+
+
+# ## Batch heuristic validation
+# `check_heuristics` certifies many heuristic tables at once with NumPy: the true costs are computed once per distinct goal and the admissibility and consistency conditions are evaluated as array comparisons over all nodes and CSR edges, a chunk of heuristics at a time.
+# The edge comparisons of a chunk are written into preallocated buffers of about 17 bytes per heuristic and edge, the chunk size is chosen so they fit into `max_chunk_bytes` (64 MiB by default, at least one heuristic per chunk); node checks and the reported offenders are computed one heuristic at a time, so the extra memory stays O(E) for a fixed budget.
+# Rows of a heuristic matrix are indexed by `as_compiled(graph)` node ids; dicts and heuristic objects are converted automatically.
+# 
+
+# In[ ]:
+
+
+from collections import namedtuple
+
+HeuristicReport = namedtuple(
+    "HeuristicReport", ["goal", "admissible", "consistent", "inadmissible_nodes", "inconsistent_edges"])
+
+
+def check_heuristics(graph, heuristics, goals, max_chunk_bytes=64 * 2**20):
+    '''
+    Vectorized check_heuristic for many heuristics.
+    heuristics: (m, V) array, or a list of dicts / heuristic objects
+    goals:      one goal per heuristic, or a single goal for all of them
+    max_chunk_bytes: memory budget for the per-edge buffers of one chunk
+    Returns a list of m HeuristicReport tuples; inadmissible_nodes lists node
+    names with h > true cost, inconsistent_edges lists (u, v) with
+    h(u) > cost(u, v) + h(v).
+    '''
+    graph = as_compiled(graph)
+    if isinstance(heuristics, np.ndarray):
+        matrix = np.asarray(heuristics, dtype=float)
+    else:
+        matrix = np.array([np.asarray(_heuristic_array(graph, h), dtype=float) for h in heuristics], dtype=float)
+    if isinstance(goals, str):
+        goals = [goals] * len(matrix)
+    if len(goals) != len(matrix):
+        raise ValueError("Need one goal per heuristic")
+
+    # true costs once per distinct goal
+    goal_rows = {}
+    for goal in goals:
+        if goal not in goal_rows:
+            goal_rows[goal] = len(goal_rows)
+    true_costs = np.array([np.frombuffer(_dijkstra_ids(graph, [graph.index[goal]]), dtype=float)
+                           for goal in goal_rows]).reshape(len(goal_rows), graph.num_nodes)
+    row_of = np.array([goal_rows[goal] for goal in goals], dtype=np.intp)
+    goal_ids = np.array([graph.index[goal] for goal in goals], dtype=np.intp)
+
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+    sources = np.repeat(np.arange(graph.num_nodes), np.diff(offsets))
+    targets = np.frombuffer(graph.targets, dtype=np.intc)
+    weights = np.frombuffer(graph.weights, dtype=float)
+
+    # h(u) and cost(u, v) + h(v) for every edge of a chunk, plus the comparison
+    chunk_size = max(1, min(len(matrix), max_chunk_bytes // (17 * max(len(targets), 1))))
+    h_sources = np.empty((chunk_size, len(targets)))
+    h_targets = np.empty((chunk_size, len(targets)))
+    bad_edges = np.empty((chunk_size, len(targets)), dtype=bool)
+
+    reports = []
+    for lo in range(0, len(matrix), chunk_size):
+        h = matrix[lo:lo + chunk_size]
+        rows = len(h)
+        np.take(h, sources, axis=1, out=h_sources[:rows])
+        np.take(h, targets, axis=1, out=h_targets[:rows])
+        np.add(h_targets[:rows], weights, out=h_targets[:rows])
+        np.greater(h_sources[:rows], h_targets[:rows], out=bad_edges[:rows])
+        goal_ok = h[np.arange(rows), goal_ids[lo:lo + rows]] == 0
+
+        for i in range(rows):
+            node_ids = np.flatnonzero(h[i] > true_costs[row_of[lo + i]])
+            edge_ids = np.flatnonzero(bad_edges[i])
+            reports.append(HeuristicReport(
+                goal=goals[lo + i],
+                admissible=len(node_ids) == 0,
+                consistent=bool(goal_ok[i]) and len(edge_ids) == 0,
+                inadmissible_nodes=[graph.names[v] for v in node_ids],
+                inconsistent_edges=[(graph.names[sources[e]], graph.names[targets[e]]) for e in edge_ids],
+            ))
+    return reports
+
+
+# ## Memory-mapped graph files
+# `save_graph` writes a compiled graph as one flat binary file: a small header, the CSR offsets, targets and weights, and a UTF-8 name table. `open_graph` maps that file with `mmap` and returns a `MappedGraph` whose arrays are views into the mapping, so opening takes milliseconds, pages are only read when a search touches them and worker processes share them through the page cache.
+# A `MappedGraph` is a `CompiledGraph`, every search accepts it directly. Name lookups use a binary search over the sorted name table instead of building a dict.
+# 
+
+# In[ ]:
+
+
+import mmap
+import struct
+from bisect import bisect_left
+
+# magic, version, byte order marker, flags, num_nodes, num_edges
+_GRAPH_HEADER = struct.Struct("=8sIIIIqq")
+_GRAPH_MAGIC = b"CSRGRAPH"
+_GRAPH_VERSION = 1
+_BYTE_ORDER_MARK = 0x01020304
+_NAMES_SORTED = 1
+
+
+def _align(offset):
+    return (offset + 7) // 8 * 8
+
+
+def save_graph(graph, path):
+    '''Writes graph (dict map or CompiledGraph) to path in the binary format read by open_graph.'''
+    graph = as_compiled(graph)
+    encoded = [name.encode("utf-8") for name in graph.names]
+    name_offsets = array('q', [0])
+    for name in encoded:
+        name_offsets.append(name_offsets[-1] + len(name))
+    names = graph.names
+    flags = _NAMES_SORTED if all(names[i] < names[i + 1] for i in range(len(names) - 1)) else 0
+
+    sections = [array('q', graph.offsets), array('i', graph.targets), array('d', graph.weights), name_offsets]
+    with open(path, "wb") as f:
+        f.write(_GRAPH_HEADER.pack(_GRAPH_MAGIC, _GRAPH_VERSION, _BYTE_ORDER_MARK, flags, 0,
+                                   graph.num_nodes, graph.num_edges))
+        for section in sections:
+            f.write(b"\0" * (_align(f.tell()) - f.tell()))
+            section.tofile(f)
+        f.write(b"".join(encoded))
+
+
+class _NameTable:
+    '''Read-only sequence id -> name, decoded from the mapped name table on access.'''
+
+    def __init__(self, name_offsets, blob):
+        self._offsets = name_offsets
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, node_id):
+        if node_id < 0:
+            node_id += len(self)
+        return bytes(self._blob[self._offsets[node_id]:self._offsets[node_id + 1]]).decode("utf-8")
+
+    def __iter__(self):
+        for node_id in range(len(self)):
+            yield self[node_id]
+
+
+class _SortedNameIndex:
+    '''Read-only mapping name -> id by binary search over a sorted _NameTable.'''
+
+    def __init__(self, names):
+        self._names = names
+
+    def get(self, name, default=None):
+        node_id = bisect_left(self._names, name)
+        if node_id < len(self._names) and self._names[node_id] == name:
+            return node_id
+        return default
+
+    def __getitem__(self, name):
+        node_id = self.get(name)
+        if node_id is None:
+            raise KeyError(name)
+        return node_id
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def __len__(self):
+        return len(self._names)
+
+
+class MappedGraph(CompiledGraph):
+    '''CompiledGraph whose arrays are memoryviews into a memory-mapped graph file.'''
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        magic, version, mark, flags, _, num_nodes, num_edges = _GRAPH_HEADER.unpack_from(view)
+        if magic != _GRAPH_MAGIC or version != _GRAPH_VERSION:
+            raise ValueError(f"{path} is not a graph file written by save_graph")
+        if mark != _BYTE_ORDER_MARK:
+            raise ValueError(f"{path} was written on a machine with a different byte order")
+
+        position = _GRAPH_HEADER.size
+        sections = []
+        for code, length in (('q', num_nodes + 1), ('i', num_edges), ('d', num_edges), ('q', num_nodes + 1)):
+            position = _align(position)
+            size = length * struct.calcsize(code)
+            sections.append(view[position:position + size].cast(code))
+            position += size
+        self.offsets, self.targets, self.weights, name_offsets = sections
+        self.names = _NameTable(name_offsets, view[position:])
+        self._index = _SortedNameIndex(self.names) if flags & _NAMES_SORTED else None
+
+    @property
+    def index(self):
+        # unsorted name tables fall back to a dict, built on first use
+        if self._index is None:
+            self._index = {name: node_id for node_id, name in enumerate(self.names)}
+        return self._index
+
+    def close(self):
+        '''Releases the views and the mapping.'''
+        for section in (self.offsets, self.targets, self.weights, self.names._offsets, self.names._blob):
+            section.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_graph(path):
+    '''Memory-maps a graph file written by save_graph.'''
+    return MappedGraph(path)
+
+
+# ## Streaming edge-list import
+# `import_edge_list` streams CSV edge exports row by row into flat int32 id and float64 weight arrays, drops self loops, merges duplicate and reversed duplicate roads (keeping the cheapest) and builds a `CompiledGraph` (or a dict map with `compiled=False`) with NumPy sorting instead of per-edge Python objects. Neighbors are listed in node-name order.
+# The rows are not kept as Python objects, but the edge arrays are held in memory for sorting: on top of the name table, importing E rows peaks at about 40·E bytes (the 16-byte rows, an 8-byte sort permutation and one sorted copy), with `bidirectional=True` about twice that because every road is stored in both directions.
+# `import_node_coordinates` reads a node coordinate CSV into an array aligned with the ids of a compiled graph.
+# 
+
+# In[ ]:
+
+
+import csv
+
+
+def _csv_columns(reader, header, columns):
+    '''Resolves column names (with a header row) or indices (without) to indices.'''
+    if not header:
+        return list(columns)
+    fields = [field.strip() for field in next(reader)]
+    return [fields.index(column) if isinstance(column, str) else column for column in columns]
+
+
+def _to_array(typecode, values):
+    result = array(typecode)
+    result.frombytes(values.tobytes())
+    return result
+
+
+def import_edge_list(path, source="source", target="target", weight="weight", header=True,
+                     bidirectional=True, compiled=True, delimiter=","):
+    '''
+    Streams an edge-list CSV (one road per row) into a graph.
+    source, target, weight: column names, or column indices with header=False
+    bidirectional: every row is a road usable in both directions; (u, v) and
+                   (v, u) rows are merged into one road
+    Returns a CompiledGraph, or a dict map if compiled=False.
+    '''
+    index = {}
+    names = []
+    sources, targets, weights = array('i'), array('i'), array('d')
+
+    def node_id(name):
+        found = index.get(name)
+        if found is None:
+            found = index[name] = len(names)
+            names.append(name)
+        return found
+
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        source_col, target_col, weight_col = _csv_columns(reader, header, (source, target, weight))
+        for row in reader:
+            if not row:
+                continue
+            u, v = node_id(row[source_col].strip()), node_id(row[target_col].strip())
+            if u != v:
+                sources.append(u)
+                targets.append(v)
+                weights.append(float(row[weight_col]))
+    del index
+
+    # renumber so ids follow the sorted names, like CompiledGraph.from_map
+    rank = np.empty(len(names), dtype=np.intc)
+    rank[np.argsort(np.array(names, dtype=object), kind="stable")] = np.arange(len(names), dtype=np.intc)
+    names.sort()
+    u = rank[np.frombuffer(sources, dtype=np.intc)]
+    v = rank[np.frombuffer(targets, dtype=np.intc)]
+    w = np.frombuffer(weights, dtype=float)
+    del rank, sources, targets, weights
+    if bidirectional:
+        swap = u > v
+        u[swap], v[swap] = v[swap], u[swap]
+        del swap
+
+    # sort by (u, v, weight) and keep the cheapest edge of every (u, v) pair
+    order = np.lexsort((w, v, u))
+    u, v, w = u[order], v[order], w[order]
+    del order
+    first = np.ones(len(u), dtype=bool)
+    first[1:] = (u[1:] != u[:-1]) | (v[1:] != v[:-1])
+    u, v, w = u[first], v[first], w[first]
+    del first
+    if bidirectional:
+        u, v, w = np.concatenate((u, v)), np.concatenate((v, u)), np.concatenate((w, w))
+        order = np.lexsort((v, u))
+        u, v, w = u[order], v[order], w[order]
+        del order
+    offsets = np.zeros(len(names) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(u, minlength=len(names)), out=offsets[1:])
+
+    graph = CompiledGraph(names, _to_array('q', offsets), _to_array('i', v), _to_array('d', w))
+    if compiled:
+        return graph
+    return {name: graph[name] for name in graph.names}
+
+
+def import_node_coordinates(path, graph, node="node", x="x", y="y", header=True, delimiter=","):
+    '''
+    Reads node coordinates from a CSV into a (V, 2) array indexed by the ids
+    of graph; nodes missing from the file get NaN.
+    '''
+    graph = as_compiled(graph)
+    coordinates = np.full((graph.num_nodes, 2), np.nan)
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        node_col, x_col, y_col = _csv_columns(reader, header, (node, x, y))
+        for row in reader:
+            if not row:
+                continue
+            node_id = graph.index.get(row[node_col].strip())
+            if node_id is not None:
+                coordinates[node_id] = (float(row[x_col]), float(row[y_col]))
+    return coordinates
+
+
+# ## All-pairs shortest paths
+# For small and medium maps `build_all_pairs` precomputes every shortest path once. The sources are split into shards that a process pool works on in parallel; the workers memory-map the graph file and write their rows straight into memory-mapped `.npy` matrices holding the cost and the next hop of every pair.
+# `AllPairsTable` opens these files again and answers `lookup(u, v) -> (cost, next_hop)` in O(1); `path` follows the next hops and returns `(path, cost)` like `a_star_search`.
+# 
+
+# In[ ]:
+
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _all_pairs_files(prefix):
+    return prefix + ".graph", prefix + ".costs.npy", prefix + ".next.npy"
+
+
+def _first_hops(parents, source_id):
+    '''next_hop[v] is the first node after source_id on the tree path to v, -1 if unreachable.'''
+    next_hop = [-1] * len(parents)
+    next_hop[source_id] = source_id
+    for v in range(len(parents)):
+        # walk up until a node whose hop is known or a child of the source
+        chain = []
+        node = v
+        while next_hop[node] == -1 and parents[node] != -1 and parents[node] != source_id:
+            chain.append(node)
+            node = parents[node]
+        if next_hop[node] == -1:
+            if parents[node] != source_id:
+                continue
+            next_hop[node] = node
+        for child in chain:
+            next_hop[child] = next_hop[node]
+    return np.array(next_hop, dtype=np.int32)
+
+
+def _all_pairs_worker(prefix, source_ids):
+    '''Fills the rows of source_ids in the memory-mapped cost and next-hop matrices.'''
+    graph_path, costs_path, next_path = _all_pairs_files(prefix)
+    costs = np.load(costs_path, mmap_mode="r+")
+    next_hops = np.load(next_path, mmap_mode="r+")
+    with open_graph(graph_path) as graph:
+        for source_id in source_ids:
+            parents = array('i', [-1]) * graph.num_nodes
+            costs[source_id] = np.frombuffer(_dijkstra_ids(graph, [source_id], parents=parents), dtype=float)
+            next_hops[source_id] = _first_hops(parents, source_id)
+    costs.flush()
+    next_hops.flush()
+    return len(source_ids)
+
+
+def build_all_pairs(graph, prefix, processes=None, shard_size=64):
+    '''
+    Computes all-pairs shortest paths of graph into the files prefix.graph,
+    prefix.costs.npy and prefix.next.npy. processes=1 runs in this process.
+    Returns the AllPairsTable for the written files.
+    '''
+    graph = as_compiled(graph)
+    graph_path, costs_path, next_path = _all_pairs_files(prefix)
+    save_graph(graph, graph_path)
+    shape = (graph.num_nodes, graph.num_nodes)
+    np.lib.format.open_memmap(costs_path, mode="w+", dtype=float, shape=shape).flush()
+    np.lib.format.open_memmap(next_path, mode="w+", dtype=np.int32, shape=shape).flush()
+
+    shards = [range(lo, min(lo + shard_size, graph.num_nodes)) for lo in range(0, graph.num_nodes, shard_size)]
+    if processes == 1:
+        for shard in shards:
+            _all_pairs_worker(prefix, shard)
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            list(pool.map(_all_pairs_worker, [prefix] * len(shards), shards))
+    return AllPairsTable(prefix)
+
+
+class AllPairsTable:
+    '''Read-only all-pairs cost and next-hop tables written by build_all_pairs.'''
+
+    def __init__(self, prefix):
+        graph_path, costs_path, next_path = _all_pairs_files(prefix)
+        self.graph = open_graph(graph_path)
+        self.costs = np.load(costs_path, mmap_mode="r")
+        self.next_hops = np.load(next_path, mmap_mode="r")
+
+    def lookup(self, u, v):
+        '''Returns (cost, next_hop) for the pair u -> v; next_hop is None if v is unreachable.'''
+        u_id, v_id = self.graph.index[u], self.graph.index[v]
+        hop = int(self.next_hops[u_id, v_id])
+        return float(self.costs[u_id, v_id]), (self.graph.names[hop] if hop != -1 else None)
+
+    def path(self, start, goal):
+        '''Returns (path, total_cost) where path includes start and goal.'''
+        cost, hop = self.lookup(start, goal)
+        if hop is None:
+            raise ValueError(f"No path found from {start} to {goal}")
+        path = [start]
+        while path[-1] != goal:
+            path.append(self.lookup(path[-1], goal)[1])
+            # zero-cost cycles could send the next hops around in circles
+            if len(path) > self.graph.num_nodes:
+                raise ValueError(f"Next hops from {start} to {goal} do not form a simple path")
+        return path, cost
+
+    def close(self):
+        del self.costs, self.next_hops
+        self.graph.close()
+
+
+# ## Anytime A* (ARA*)
+# `a_star_search(..., epsilon=e)` trades optimality for speed: with an admissible heuristic the returned cost is at most `(1 + e)` times optimal.
+# `anytime_a_star_search` starts with a large `epsilon`, yields a first `(path, cost)` quickly and then keeps lowering `epsilon`, reusing the search effort of the previous rounds (ARA*), and yields every cheaper solution until `epsilon` reaches 0 or the time or expansion budget runs out.
+# 
+
+# In[ ]:
+
+
+def anytime_a_star_search(graph, start, goal, heuristic, epsilon=2.0, step=0.5,
+                          time_limit=None, max_expansions=None):
+    '''
+    Anytime Repairing A*. Generator of (path, total_cost) pairs with
+    decreasing cost; the solution found with epsilon == 0 is optimal for an
+    admissible heuristic.
+    epsilon:        suboptimality bound of the first round
+    step:           how much epsilon is lowered after every round
+    time_limit:     seconds after which the search stops
+    max_expansions: total number of node expansions after which the search stops
+    '''
+    if epsilon < 0:
+        raise ValueError(f"epsilon must be >= 0, got {epsilon}")
+    if step <= 0:
+        raise ValueError(f"step must be > 0, got {step}")
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
+    g_score = {start: 0}
+    came_from = {}
+    open_keys = {}  # node -> key of its current open_set entry
+    open_set = []
+    inconsistent = set()  # improved after being closed in this round
+    closed = set()
+    expansions = 0
+    best_cost = float('inf')
+
+    def push(node, weight):
+        key = g_score[node] + weight * heuristic[node]
+        open_keys[node] = key
+        heapq.heappush(open_set, (key, node))
+
+    push(start, 1 + epsilon)
+    while True:
+        weight = 1 + epsilon
+        # improve path: expand while the goal could still get cheaper within the bound
+        while open_set:
+            key, current = open_set[0]
+            if open_keys.get(current) != key:
+                heapq.heappop(open_set)
+                continue
+            if g_score.get(goal, float('inf')) <= key:
+                break
+            if (deadline is not None and time.perf_counter() > deadline) or \
+                    (max_expansions is not None and expansions >= max_expansions):
+                return
+            heapq.heappop(open_set)
+            del open_keys[current]
+            closed.add(current)
+            expansions += 1
+
+            for neighbor, edge_cost in graph.get(current, []):
+                tentative_g = g_score[current] + edge_cost
+                if tentative_g < g_score.get(neighbor, float('inf')):
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g
+                    # the last round re-opens closed nodes like a_star_search,
+                    # so inconsistent heuristics still end with the optimum
+                    if neighbor in closed and epsilon > 0:
+                        inconsistent.add(neighbor)
+                    else:
+                        push(neighbor, weight)
+
+        cost = g_score.get(goal, float('inf'))
+        if cost == float('inf'):
+            raise ValueError(f"No path found from {start} to {goal}")
+        if cost < best_cost:
+            best_cost = cost
+            yield reconstruct_path(came_from, goal), cost
+        if epsilon <= 0:
+            return
+
+        # next round: smaller bound, reopen the inconsistent nodes, rebuild the keys
+        epsilon = max(0, epsilon - step)
+        weight = 1 + epsilon
+        waiting = set(open_keys) | inconsistent
+        open_keys.clear()
+        open_set.clear()
+        inconsistent.clear()
+        closed.clear()
+        for node in waiting:
+            push(node, weight)
+
+
+# ## Benchmark suite
+# `run_benchmarks` generates synthetic graphs of growing size, runs `depth_first_search`, `a_star_search`, `compute_true_costs` and `check_heuristic` on them and returns (or writes) a JSON report, so runs of different versions can be compared.
+# 
+# - `grid_graph`: 4-connected grid, edge weights in [1, 2).
+# - `random_geometric_graph`: random points, roads between all points closer than a radius chosen for the given mean degree, weights are the distances.
+# - `scale_free_graph`: Barabási–Albert preferential attachment on random points, weights at least the distance.
+# 
+# Every generator returns `(graph, coordinates)` and no road is shorter than the straight line between its ends, so the Euclidean distance to the goal is an admissible heuristic (a `CoordinateHeuristic`, see below). The graphs are built with NumPy and get numbered names (`n0000042`), 10⁷ nodes fit in memory but searching them in pure Python takes a while.
+# Throughput is measured without tracing, the peak memory of one extra run with `tracemalloc`.
+# The suite is not part of the quick checks, run it on its own, e.g. `run_benchmarks(sizes=(10**4, 10**5), output="benchmarks.json")`.
+# 
+
+# In[ ]:
+
+
+import platform
+import tracemalloc
+
+
+class _NumberedNames:
+    '''Read-only sequence id -> "n<id>" with zero padding, so names sort like ids.'''
+
+    def __init__(self, count):
+        self._count = count
+        self._width = len(str(max(count - 1, 0)))
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, node_id):
+        if node_id < 0:
+            node_id += self._count
+        if not 0 <= node_id < self._count:
+            raise IndexError(node_id)
+        return f"n{node_id:0{self._width}d}"
+
+    def __iter__(self):
+        for node_id in range(self._count):
+            yield self[node_id]
+
+
+class _NumberedGraph(CompiledGraph):
+    '''CompiledGraph with generated node names, built from undirected edge arrays.'''
+
+    def __init__(self, num_nodes, u, v, w):
+        u, v, w = np.concatenate((u, v)), np.concatenate((v, u)), np.concatenate((w, w))
+        order = np.argsort(u * num_nodes + v)
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(u, minlength=num_nodes), out=offsets[1:])
+        self.names = _NumberedNames(num_nodes)
+        self.index = _SortedNameIndex(self.names)
+        self.offsets = _to_array('q', offsets)
+        self.targets = _to_array('i', v[order].astype(np.intc))
+        self.weights = _to_array('d', w[order].astype(float))
+
+
+def _distances(coordinates, u, v):
+    return np.hypot(*(coordinates[u] - coordinates[v]).T)
+
+
+def grid_graph(n, seed=None):
+    '''Square 4-connected grid with about n nodes and random weights in [1, 2).'''
+    rng = np.random.default_rng(seed)
+    side = max(int(round(n ** 0.5)), 1)
+    ids = np.arange(side * side).reshape(side, side)
+    u = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel()))
+    v = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel()))
+    coordinates = np.column_stack((ids.ravel() % side, ids.ravel() // side)).astype(float)
+    return _NumberedGraph(side * side, u, v, 1 + rng.random(len(u))), coordinates
+
+
+def random_geometric_graph(n, degree=8, seed=None):
+    '''
+    n random points in a square of area n, roads between all points closer
+    than the radius that gives the requested mean degree.
+    '''
+    rng = np.random.default_rng(seed)
+    radius = (degree / np.pi) ** 0.5
+    points = rng.random((n, 2)) * n ** 0.5
+
+    # bucket the points into radius-sized cells (one cell of padding on every
+    # side) and number the nodes by cell, so only neighboring cells are compared
+    cells = np.floor(points / radius).astype(np.int64) + 1
+    height = cells[:, 1].max() + 2
+    keys = cells[:, 0] * height + cells[:, 1]
+    order = np.argsort(keys, kind="stable")
+    points, keys = points[order], keys[order]
+    counts = np.bincount(keys, minlength=(cells[:, 0].max() + 2) * height)
+    starts = np.cumsum(counts) - counts
+
+    us, vs = [], []
+    for dx, dy in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+        neighbor_keys = keys + dx * height + dy
+        pair_counts = counts[neighbor_keys]
+        u = np.repeat(np.arange(n), pair_counts)
+        first = np.cumsum(pair_counts) - pair_counts
+        v = np.repeat(starts[neighbor_keys] - first, pair_counts) + np.arange(len(u))
+        keep = _distances(points, u, v) <= radius
+        if dx == dy == 0:
+            keep &= u < v
+        us.append(u[keep])
+        vs.append(v[keep])
+    u, v = np.concatenate(us), np.concatenate(vs)
+    return _NumberedGraph(n, u, v, _distances(points, u, v)), points
+
+
+def scale_free_graph(n, m=3, seed=None):
+    '''
+    Barabási–Albert graph: every new node links to m earlier nodes picked with
+    probability proportional to their degree. Nodes get random points in a
+    square of area n, road weights are 1 to 1.5 times the distance.
+    '''
+    rng = np.random.default_rng(seed)
+    m = max(min(m, n - 1), 1)
+    # edge k is added by node m + k // m; node m links to all initial nodes
+    creators = m + np.arange(m * (n - m)) // m
+    ends = np.full(len(creators), -1, dtype=np.int64)
+    ends[:m] = np.arange(m)
+    # later edges pick a uniform end of an edge added before their node, i.e. a
+    # node with probability proportional to its degree so far
+    picks = (rng.random(len(creators) - m) * 2 * m * (creators[m:] - m)).astype(np.int64)
+    earlier = picks // 2
+    ends[m:] = np.where(picks % 2 == 0, creators[earlier], -1)
+    pointer = np.where(ends < 0, np.concatenate((np.zeros(m, dtype=np.int64), earlier)), 0)
+    unresolved = np.flatnonzero(ends < 0)
+    while len(unresolved):
+        target = pointer[unresolved]
+        resolved = ends[target] >= 0
+        ends[unresolved[resolved]] = ends[target[resolved]]
+        unresolved = unresolved[~resolved]
+        pointer[unresolved] = pointer[pointer[unresolved]]
+
+    # links picked twice become one road
+    pairs = np.sort(np.minimum(creators, ends) * n + np.maximum(creators, ends))
+    pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))]
+    u, v = pairs // n, pairs % n
+    points = rng.random((n, 2)) * n ** 0.5
+    weights = _distances(points, u, v) * (1 + 0.5 * rng.random(len(u)))
+    return _NumberedGraph(n, u, v, weights), points
+
+
+BENCHMARK_GRAPHS = {
+    "grid": grid_graph,
+    "geometric": random_geometric_graph,
+    "scale_free": scale_free_graph,
+}
+
+BENCHMARK_SEARCHES = ("depth_first_search", "a_star_search", "compute_true_costs", "check_heuristic")
+
+# searches that take a queue="lazy" / "indexed" argument
+BENCHMARK_QUEUE_SEARCHES = ("a_star_search", "compute_true_costs")
+
+
+def _run_benchmark_search(search, queue, graph, start_id, goal_id, heuristic, stats):
+    start, goal = graph.names[start_id], graph.names[goal_id]
+    if search == "depth_first_search":
+        depth_first_search(graph, start, goal, stats=stats)
+    elif search == "a_star_search":
+        a_star_search(graph, start, goal, heuristic, stats=stats, queue=queue)
+    elif search == "compute_true_costs":
+        compute_true_costs(graph, goal, stats=stats, queue=queue)
+    else:
+        check_heuristic(graph, heuristic, goal)
+
+
+def _benchmark_search(search, queue, graph, coordinates, pairs):
+    '''Times search over all (start_id, goal_id) pairs, then traces the memory of the first one.'''
+    stats = SearchStats()
+    seconds = 0.0
+    found = 0
+    for start_id, goal_id in pairs:
+        heuristic = coordinates.heuristic(graph.names[goal_id])
+        started = time.perf_counter()
+        try:
+            _run_benchmark_search(search, queue, graph, start_id, goal_id, heuristic, stats)
+            found += 1
+        except ValueError:
+            pass
+        seconds += time.perf_counter() - started
+
+    start_id, goal_id = pairs[0]
+    heuristic = coordinates.heuristic(graph.names[goal_id])
+    tracemalloc.start()
+    try:
+        _run_benchmark_search(search, queue, graph, start_id, goal_id, heuristic, None)
+    except ValueError:
+        pass
+    finally:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    expansions = stats.expansions if stats.searches else None
+    return {
+        "search": search,
+        "queue": queue,
+        "queries": len(pairs),
+        "found": found,
+        "seconds": seconds,
+        "queries_per_second": len(pairs) / seconds if seconds else None,
+        "expansions": expansions,
+        "expansions_per_second": expansions / seconds if expansions and seconds else None,
+        "peak_open": stats.peak_open if stats.searches else None,
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def run_benchmarks(sizes=(10**3, 10**4, 10**5, 10**6, 10**7), families=tuple(BENCHMARK_GRAPHS),
+                   searches=BENCHMARK_SEARCHES, queues=("lazy", "indexed"), queries=10, seed=0, output=None):
+    '''
+    Benchmarks the searches on generated graphs.
+    sizes:    node counts, every family is generated at every size
+    families: keys of BENCHMARK_GRAPHS
+    searches: names from BENCHMARK_SEARCHES
+    queues:   priority queues the searches in BENCHMARK_QUEUE_SEARCHES are
+              run with, every one gets its own result
+    queries:  random (start, goal) pairs per search, compute_true_costs and
+              check_heuristic only use the goals
+    output:   optional path the JSON report is written to
+    Returns the report as a dict with "meta" and one "results" entry per
+    family, size, search and queue.
+    '''
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "seed": seed,
+            "queries": queries,
+        },
+        "results": [],
+    }
+    for family in families:
+        for size in sizes:
+            started = time.perf_counter()
+            graph, points = BENCHMARK_GRAPHS[family](size, seed=seed)
+            build_seconds = time.perf_counter() - started
+            coordinates = NodeCoordinates(points, graph)
+            graph_bytes = sum(len(a) * a.itemsize for a in (graph.offsets, graph.targets, graph.weights))
+            rng = np.random.default_rng(seed)
+            pairs = rng.integers(graph.num_nodes, size=(queries, 2)).tolist()
+            for search in searches:
+                for queue in (queues if search in BENCHMARK_QUEUE_SEARCHES else (None,)):
+                    result = {
+                        "family": family,
+                        "nodes": graph.num_nodes,
+                        "edges": graph.num_edges,
+                        "graph_bytes": graph_bytes,
+                        "build_seconds": build_seconds,
+                    }
+                    result.update(_benchmark_search(search, queue, graph, coordinates, pairs))
+                    report["results"].append(result)
+            del graph, points, coordinates
+
+    if output is not None:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+# ## Memory-bounded search (IDA*, SMA*)
+# `a_star_search` keeps a `g_score`, `f_score` and `came_from` entry for every node it reaches. The two searches below return `(path, cost)` like `a_star_search` but bound that memory, at the price of searching parts of the graph more than once.
+# 
+# - `ida_star_search` (iterative deepening A*) runs depth-first searches with a growing f-bound and only stores the current path.
+# - `sma_star_search` (simplified memory-bounded A*) works like A* on the search tree but never keeps more than `max_nodes` tree nodes. When memory is full it forgets the leaf with the highest f and remembers its f in the parent, which is regenerated later if that branch becomes the best again. The result is optimal if the optimal path has at most `max_nodes` nodes.
+# 
+# Both search the tree of paths instead of the graph: `ida_star_search` only avoids cycles, `sma_star_search` also skips a child if the same node is in memory with a path that is not more expensive. On graphs with many equally good paths (grids) they are much slower than `a_star_search`, especially with a tight `max_nodes`.
+# 
+
+# In[ ]:
+
+
+def ida_star_search(graph, start, goal, heuristic):
+    '''
+    Iterative deepening A*, memory proportional to the path length.
+    Returns (path, total_cost) where path includes start and goal; optimal
+    for an admissible heuristic.
+    '''
+    if start == goal:
+        return [start], 0
+
+    bound = heuristic[start]
+    while True:
+        next_bound = float('inf')
+        path, costs, on_path = [start], [0], {start}
+        stack = [iter(graph.get(start, []))]
+
+        while stack:
+            for neighbor, edge_cost in stack[-1]:
+                if neighbor in on_path:
+                    continue
+                g = costs[-1] + edge_cost
+                f = g + heuristic[neighbor]
+                if f > bound:
+                    next_bound = min(next_bound, f)
+                    continue
+                if neighbor == goal:
+                    return path + [neighbor], g
+                path.append(neighbor)
+                costs.append(g)
+                on_path.add(neighbor)
+                stack.append(iter(graph.get(neighbor, [])))
+                break
+            else:
+                stack.pop()
+                on_path.discard(path.pop())
+                costs.pop()
+
+        if next_bound == float('inf'):
+            raise ValueError(f"No path found from {start} to {goal}")
+        bound = next_bound
+
+
+class _TreeNode:
+    '''Search tree node of sma_star_search.'''
+    __slots__ = ("node", "g", "f", "depth", "parent", "children", "forgotten", "dropped")
+
+    def __init__(self, node, g, f, parent):
+        self.node = node
+        self.g = g
+        self.f = f
+        self.depth = parent.depth + 1 if parent is not None else 1
+        self.parent = parent
+        self.children = []
+        self.forgotten = None  # node -> f of forgotten children, None until expanded
+        self.dropped = False
+
+    def open_key(self):
+        # unexpanded nodes wait for their expansion, expanded ones for
+        # regenerating their best forgotten child
+        if self.forgotten is None:
+            return self.f
+        return min(self.forgotten.values(), default=float('inf'))
+
+    def backed_up_f(self):
+        return min([child.f for child in self.children] + list(self.forgotten.values()), default=float('inf'))
+
+    def path(self):
+        nodes = []
+        current = self
+        while current is not None:
+            nodes.append(current.node)
+            current = current.parent
+        return nodes[::-1]
+
+
+def sma_star_search(graph, start, goal, heuristic, max_nodes=100_000):
+    '''
+    Simplified memory-bounded A*, keeps at most max_nodes search tree nodes
+    (plus the f of every forgotten child of a node in memory).
+    Returns (path, total_cost) where path includes start and goal; optimal
+    for an admissible heuristic if the optimal path has at most max_nodes nodes.
+    Raises ValueError if there is no path that fits into max_nodes nodes.
+    '''
+    if max_nodes < 1:
+        raise ValueError("max_nodes must be at least 1")
+
+    counter = 0
+    root = _TreeNode(start, 0, heuristic[start], None)
+    open_set = [(root.f, -root.depth, counter, root)]  # lowest f, deepest first
+    leaves = [(-root.f, root.depth, counter, root)]    # highest f, shallowest first
+    in_memory = 1
+    cheapest_copy = {root.node: root}  # node -> tree node in memory with the lowest g
+
+    def forget_worst_leaf(keep):
+        '''Drops the worst leaf other than keep, returns False if there is none.'''
+        nonlocal in_memory, counter
+        skipped = []
+        forgotten = False
+        while leaves:
+            entry = heapq.heappop(leaves)
+            leaf = entry[3]
+            if leaf.dropped or leaf.children or leaf.parent is None or -entry[0] != leaf.f:
+                continue
+            if leaf is keep:
+                skipped.append(entry)
+                continue
+            parent = leaf.parent
+            parent.children.remove(leaf)
+            parent.forgotten[leaf.node] = leaf.f
+            leaf.dropped = True
+            if cheapest_copy.get(leaf.node) is leaf:
+                del cheapest_copy[leaf.node]
+            in_memory -= 1
+            counter += 1
+            heapq.heappush(open_set, (parent.open_key(), -parent.depth, counter, parent))
+            if not parent.children:
+                heapq.heappush(leaves, (-parent.f, parent.depth, counter, parent))
+            forgotten = True
+            break
+        for entry in skipped:
+            heapq.heappush(leaves, entry)
+        return forgotten
+
+    while open_set:
+        key, _, _, best = heapq.heappop(open_set)
+        if best.dropped or key != best.open_key():
+            continue
+        if key == float('inf'):
+            break
+        if best.node == goal:
+            return best.path(), best.g
+
+        cheapest = {}
+        for neighbor, edge_cost in graph.get(best.node, []):
+            cheapest[neighbor] = min(edge_cost, cheapest.get(neighbor, float('inf')))
+        if best.forgotten is None:
+            # first expansion: every successor off the path, pathmax keeps a
+            # child from being cheaper than its parent
+            best.forgotten = {}
+            on_path = set(best.path())
+            successors = []
+            for neighbor, edge_cost in cheapest.items():
+                if neighbor in on_path:
+                    continue
+                g = best.g + edge_cost
+                f = max(g + heuristic[neighbor], best.f)
+                if neighbor != goal and best.depth + 1 >= max_nodes:
+                    f = float('inf')  # its path cannot be extended within max_nodes
+                successors.append((f, neighbor, g))
+            successors.sort(key=lambda successor: successor[0])
+        else:
+            # regenerate the best forgotten child with its remembered f
+            neighbor = min(best.forgotten, key=best.forgotten.get)
+            successors = [(best.forgotten.pop(neighbor), neighbor, best.g + cheapest[neighbor])]
+        # a copy in memory reached at most as expensively and as deep covers
+        # every path through this child; dead children are not stored
+        for i, (f, neighbor, g) in enumerate(successors):
+            other = cheapest_copy.get(neighbor)
+            if other is not None and other.g <= g and other.depth <= best.depth + 1:
+                successors[i] = (float('inf'), neighbor, g)
+        for f, neighbor, g in successors:
+            if f == float('inf'):
+                best.forgotten[neighbor] = f
+        successors = [successor for successor in successors if successor[0] != float('inf')]
+
+        while in_memory + len(successors) > max_nodes and forget_worst_leaf(best):
+            pass
+        room = max(max_nodes - in_memory, 0)
+        for f, neighbor, g in successors[room:]:
+            best.forgotten[neighbor] = f
+        for f, neighbor, g in successors[:room]:
+            child = _TreeNode(neighbor, g, f, best)
+            best.children.append(child)
+            cheapest_copy[neighbor] = child
+            in_memory += 1
+            counter += 1
+            heapq.heappush(open_set, (child.f, -child.depth, counter, child))
+            heapq.heappush(leaves, (-child.f, child.depth, counter, child))
+        counter += 1
+        heapq.heappush(open_set, (best.open_key(), -best.depth, counter, best))
+
+        # back up the lowest f of the children through the ancestors
+        current = best
+        while current is not None:
+            backed_up = current.backed_up_f()
+            if backed_up == current.f:
+                break
+            current.f = backed_up
+            if not current.children:
+                counter += 1
+                heapq.heappush(leaves, (-current.f, current.depth, counter, current))
+            current = current.parent
+
+    raise ValueError(f"No path found from {start} to {goal} within {max_nodes} search tree nodes")
+
+
+# ## Coordinate heuristics
+# The heuristics above are tables for one fixed goal. `NodeCoordinates` keeps the node positions of a map instead and `NodeCoordinates.heuristic(goal)` returns a `CoordinateHeuristic` for any goal that computes the straight-line distance when a node is looked up, so a new destination needs no O(V) table first. `metric="euclidean"` is the plane distance of `(x, y)` positions, `metric="haversine"` the great-circle distance in km of `(latitude, longitude)` positions in degrees.
+# 
+# - Positions are a dict `name -> (x, y)` for dict maps, or an array aligned with the ids of a `CompiledGraph` (as returned by `import_node_coordinates` or the benchmark generators).
+# - A `CoordinateHeuristic` can be passed wherever a heuristic dict is accepted. On compiled graphs `lookup(graph)` works on ids and `array(graph)` computes all estimates at once with NumPy (used by `check_heuristic`).
+# - Nodes without a position (missing or NaN) get the estimate 0, which keeps the heuristic admissible.
+# 
+
+# In[ ]:
+
+
+import math
+
+_EARTH_RADIUS_KM = 6371.0088
+
+germany_coordinates = {
+    "Berlin": (52.5200, 13.4050),
+    "Hamburg": (53.5511, 9.9937),
+    "Leipzig": (51.3397, 12.3731),
+    "Frankfurt": (50.1109, 8.6821),
+    "Cologne": (50.9375, 6.9603),
+    "Stuttgart": (48.7758, 9.1829),
+    "Munich": (48.1351, 11.5820),
+}
+
+
+class NodeCoordinates:
+    '''
+    Node positions for straight-line heuristics towards any goal.
+    positions: dict name -> (x, y), or a (V, 2) array aligned with the ids of graph
+    graph:     the CompiledGraph the rows of a positions array belong to
+    metric:    "euclidean", or "haversine" for (latitude, longitude) in
+               degrees with distances in km
+    scale:     factor applied to every distance, e.g. to convert units
+    '''
+
+    def __init__(self, positions, graph=None, metric="euclidean", scale=1.0):
+        if metric not in ("euclidean", "haversine"):
+            raise ValueError(f"Unknown metric {metric!r}, expected 'euclidean' or 'haversine'")
+        if isinstance(positions, dict):
+            self.names = list(positions)
+            self.index = {name: row for row, name in enumerate(self.names)}
+            points = np.array([positions[name] for name in self.names], dtype=float).reshape(-1, 2)
+        else:
+            if graph is None:
+                raise ValueError("A positions array needs the graph its rows belong to")
+            self.names, self.index = graph.names, graph.index
+            points = np.asarray(positions, dtype=float).reshape(-1, 2)
+        if metric == "haversine":
+            points = np.radians(points)
+        self.graph = graph
+        self.points = points
+        self.metric = metric
+        self.scale = scale
+        self._has_missing = bool(np.isnan(points).any())
+        self._first = _to_array('d', np.ascontiguousarray(points[:, 0]))
+        self._second = _to_array('d', np.ascontiguousarray(points[:, 1]))
+        self._cos_first = _to_array('d', np.cos(points[:, 0])) if metric == "haversine" else None
+        self._rows_by_graph = weakref.WeakKeyDictionary()
+
+    def heuristic(self, goal):
+        return CoordinateHeuristic(self, goal)
+
+    def _distance_to(self, goal_row):
+        '''Returns a function row -> distance of that row to goal_row.'''
+        first, second, scale = self._first, self._second, self.scale
+        goal_first, goal_second = first[goal_row], second[goal_row]
+        if self.metric == "euclidean":
+            hypot = math.hypot
+
+            def distance(row):
+                return hypot(first[row] - goal_first, second[row] - goal_second) * scale
+        else:
+            cos_first, goal_cos = self._cos_first, self._cos_first[goal_row]
+            sin, asin, sqrt = math.sin, math.asin, math.sqrt
+            factor = 2 * _EARTH_RADIUS_KM * scale
+
+            def distance(row):
+                a = sin((first[row] - goal_first) / 2) ** 2 + \
+                    cos_first[row] * goal_cos * sin((second[row] - goal_second) / 2) ** 2
+                return factor * asin(min(sqrt(a), 1.0))
+
+        if not self._has_missing:
+            return distance
+
+        def known_distance(row):
+            d = distance(row)
+            return d if d == d else 0.0
+        return known_distance
+
+    def distances(self, goal_row, rows=None):
+        '''Distances of all rows (or the given row array) to goal_row as a NumPy array.'''
+        points = self.points if rows is None else self.points[rows]
+        goal = self.points[goal_row]
+        if self.metric == "euclidean":
+            d = np.hypot(points[:, 0] - goal[0], points[:, 1] - goal[1])
+        else:
+            a = np.sin((points[:, 0] - goal[0]) / 2) ** 2 + \
+                np.cos(points[:, 0]) * np.cos(goal[0]) * np.sin((points[:, 1] - goal[1]) / 2) ** 2
+            d = 2 * _EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+        return np.nan_to_num(d * self.scale, nan=0.0)
+
+    def rows(self, graph):
+        '''Position row of every id of graph (-1 without a position), None if the ids are the rows.'''
+        if graph is self.graph:
+            return None
+        rows = self._rows_by_graph.get(graph)
+        if rows is None:
+            index = self.index
+            rows = np.fromiter((index.get(name, -1) for name in graph.names), dtype=np.int64,
+                               count=graph.num_nodes)
+            self._rows_by_graph[graph] = rows
+        return rows
+
+
+class CoordinateHeuristic:
+    '''Straight-line distance to one goal, computed when a node is looked up.'''
+
+    def __init__(self, coordinates, goal):
+        self.coordinates = coordinates
+        self.goal = goal
+        self.goal_row = coordinates.index[goal]
+        self._distance = coordinates._distance_to(self.goal_row)
+
+    def __getitem__(self, node):
+        row = self.coordinates.index.get(node)
+        return self._distance(row) if row is not None else 0.0
+
+    def get(self, node, default=None):
+        if node not in self.coordinates.index:
+            return default
+        return self[node]
+
+    def lookup(self, graph):
+        '''Returns a function node_id -> estimate for ids of graph.'''
+        rows = self.coordinates.rows(graph)
+        if rows is None:
+            return self._distance
+        rows, distance = rows.tolist(), self._distance
+        return lambda node_id: distance(rows[node_id]) if rows[node_id] >= 0 else 0.0
+
+    def array(self, graph):
+        '''All estimates for the ids of graph at once.'''
+        rows = self.coordinates.rows(graph)
+        if rows is None:
+            return _to_array('d', self.coordinates.distances(self.goal_row))
+        estimates = np.zeros(graph.num_nodes)
+        known = rows >= 0
+        estimates[known] = self.coordinates.distances(self.goal_row, rows[known])
+        return _to_array('d', estimates)
+
+
+# ## K shortest paths (Yen)
+# `k_shortest_paths` returns up to `k` loopless alternative routes `[(path, cost), ...]` from start to goal, cheapest first, using Yen's algorithm: every further path leaves an earlier one at a spur node and continues with the cheapest spur path that avoids the earlier nodes (no loops) and the edges already used by paths with the same prefix.
+# 
+# - One Dijkstra from the goal gives the exact remaining cost of every node and a shortest-path tree towards the goal, shared by all spur searches. Like `compute_true_costs` it relies on the map being bidirectional.
+# - If the tree path from the spur node avoids the blocked nodes and edges, it is the spur path and no search runs. Otherwise the spur search is an A* that uses the tree costs as heuristic; they are exact on the original map and never overestimate once edges and nodes are removed.
+# - Spur searches are pruned at the cost of the candidate that would be path number `k` already, and only spur nodes from the point where a path left its parent are tried (Lawler's refinement).
+# - The result has fewer than `k` entries if the map has fewer loopless paths. Costs are floats because the map is compiled.
+# 
+
+# In[ ]:
+
+
+def _path_prefix_costs(graph, path_ids):
+    '''Cost of path_ids[:i + 1] for every i, the cheapest edge between consecutive nodes.'''
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    prefix = [0.0]
+    for node, successor in zip(path_ids, path_ids[1:]):
+        cost = min(weights[e] for e in range(offsets[node], offsets[node + 1]) if targets[e] == successor)
+        prefix.append(prefix[-1] + cost)
+    return prefix
+
+
+def _spur_search(graph, spur, goal, to_goal, tree, blocked, removed, bound):
+    '''
+    Cheapest path ids from spur to goal that avoid the blocked nodes and the
+    edges spur -> removed, or None if every such path costs more than bound.
+    to_goal / tree: costs and next hops towards goal on the unmodified graph
+    '''
+    if to_goal[spur] > bound:
+        return None
+    # the tree path only needs checking at its first hop, removed edges all leave spur
+    if tree[spur] not in removed:
+        path = [spur]
+        while path[-1] != goal and tree[path[-1]] not in blocked:
+            path.append(tree[path[-1]])
+        if path[-1] == goal:
+            return path
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    g_score = {spur: 0}
+    came_from = {}
+    open_set = [(to_goal[spur], spur)]
+    while open_set:
+        f, current = heapq.heappop(open_set)
+        if f > g_score[current] + to_goal[current]:
+            continue
+        if current == goal:
+            return reconstruct_path(came_from, current)
+        g_current = g_score[current]
+        for e in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[e]
+            if neighbor in blocked or (current == spur and neighbor in removed):
+                continue
+            tentative_g = g_current + weights[e]
+            total_f = tentative_g + to_goal[neighbor]
+            if total_f <= bound and tentative_g < g_score.get(neighbor, float('inf')):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                heapq.heappush(open_set, (total_f, neighbor))
+    return None
+
+
+def k_shortest_paths(graph, start, goal, k, stats=None):
+    '''
+    Up to k loopless paths from start to goal (Yen's algorithm).
+    Returns [(path, total_cost), ...] ordered by cost, the first entry is a
+    shortest path. Raises ValueError if goal is unreachable.
+    stats: optional SearchStats that records the goal tree search
+    '''
+    graph = as_compiled(graph)
+    start_id, goal_id = graph.index[start], graph.index[goal]
+    run = stats.start("k_shortest_paths") if stats is not None else None
+    tree = array('i', [-1]) * graph.num_nodes
+    to_goal = _dijkstra_ids(graph, [goal_id], parents=tree, run=run)
+    if run:
+        stats.finish(run)
+    if to_goal[start_id] == float('inf'):
+        raise ValueError(f"No path found from {start} to {goal}")
+
+    accepted = []   # (path ids, prefix costs, deviation index)
+    candidates = []  # heap of (cost, path ids, deviation index)
+    seen = set()
+    path = [start_id]
+    while path[-1] != goal_id:
+        path.append(tree[path[-1]])
+    candidates.append((to_goal[start_id], tuple(path), 0))
+    seen.add(tuple(path))
+
+    while candidates and len(accepted) < k:
+        _, path, deviation = heapq.heappop(candidates)
+        prefix = _path_prefix_costs(graph, path)
+        accepted.append((path, prefix, deviation))
+        if len(accepted) == k:
+            break
+
+        for i in range(deviation, len(path) - 1):
+            spur = path[i]
+            root = path[:i + 1]
+            removed = {other[i + 1] for other, _, _ in accepted if other[:i + 1] == root}
+            # a candidate costing more than the (k - accepted)-th cheapest one is never used
+            needed = k - len(accepted)
+            bound = float('inf')
+            if len(candidates) >= needed:
+                bound = heapq.nsmallest(needed, candidates)[-1][0] - prefix[i]
+            spur_path = _spur_search(graph, spur, goal_id, to_goal, tree, set(root[:-1]), removed, bound)
+            if spur_path is None:
+                continue
+            candidate = root[:-1] + tuple(spur_path)
+            if candidate in seen:
+                continue
+            seen.add(candidate)
+            cost = prefix[i] + _path_prefix_costs(graph, spur_path)[-1]
+            heapq.heappush(candidates, (cost, candidate, i))
+
+    names = graph.names
+    return [([names[node_id] for node_id in path], prefix[-1]) for path, prefix, _ in accepted]
+
+
+# ## Occupancy grids and Jump Point Search
+# Robot and warehouse maps are occupancy grids. `GridMap` keeps them as a 2-D NumPy bool array (`True` = blocked) instead of a dict of neighbor lists. Cells are `(row, col)` tuples, moves go to the 8 neighbors, straight moves cost 1 and diagonal moves `sqrt(2)`. A diagonal move needs both adjacent straight cells free, so paths never cut corners.
+# 
+# - A `GridMap` behaves like a read-only map, so `a_star_search(grid, start, goal, grid.heuristic(goal))` works directly; `grid.heuristic(goal)` is the octile distance, the exact cost on an empty grid.
+# - `jump_point_search(grid, start, goal)` returns `(path, cost)` like `a_star_search` with the same optimal cost (up to float rounding; equally short paths may differ). On open areas plain A* expands every cell of many symmetric paths; Jump Point Search scans straight and diagonal runs instead and only puts cells on the heap where a path may have to turn (jump points), so it expands far fewer nodes. The returned path lists every cell, not only the jump points.
+# 
+
+# In[ ]:
+
+
+_SQRT2 = math.sqrt(2)
+
+
+class GridMap:
+    '''
+    8-connected occupancy grid, cells are (row, col) tuples.
+    occupancy: 2-D bool array, True marks a blocked cell
+    Internally cells are ids into a copy padded with one blocked border,
+    so the searches need no bounds checks.
+    '''
+
+    def __init__(self, occupancy):
+        occupancy = np.asarray(occupancy, dtype=bool)
+        if occupancy.ndim != 2:
+            raise ValueError("occupancy must be a 2-D array")
+        self.occupancy = occupancy
+        self.shape = occupancy.shape
+        self._width = occupancy.shape[1] + 2
+        padded = np.zeros((occupancy.shape[0] + 2, self._width), dtype=np.uint8)
+        padded[1:-1, 1:-1] = ~occupancy
+        self._free = bytearray(padded.tobytes())  # 1 = free
+
+    @classmethod
+    def from_strings(cls, rows, blocked="#"):
+        '''Grid from lines of text, characters in blocked mark obstacles.'''
+        return cls(np.array([[char in blocked for char in row] for row in rows], dtype=bool))
+
+    def _node(self, cell):
+        row, col = cell
+        if not (0 <= row < self.shape[0] and 0 <= col < self.shape[1]) or self.occupancy[row, col]:
+            raise ValueError(f"{cell} is not a free cell of the grid")
+        return (row + 1) * self._width + col + 1
+
+    def _cell(self, node):
+        row, col = divmod(node, self._width)
+        return row - 1, col - 1
+
+    def _moves(self, node):
+        '''Yield (neighbor id, cost) for the allowed moves from node.'''
+        free, width = self._free, self._width
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                neighbor = node + dr * width + dc
+                if neighbor == node or not free[neighbor]:
+                    continue
+                if dr and dc:
+                    if free[node + dr * width] and free[node + dc]:
+                        yield neighbor, _SQRT2
+                else:
+                    yield neighbor, 1.0
+
+    def heuristic(self, goal):
+        '''Octile distance to goal.'''
+        return OctileHeuristic(self, goal)
+
+    # Read-only mapping view so a_star_search and the other map functions accept a grid.
+    def __getitem__(self, cell):
+        return [(self._cell(neighbor), cost) for neighbor, cost in self._moves(self._node(cell))]
+
+    def get(self, cell, default=None):
+        if cell not in self:
+            return default
+        return self[cell]
+
+    def __contains__(self, cell):
+        try:
+            self._node(cell)
+        except (TypeError, ValueError):
+            return False
+        return True
+
+    def __iter__(self):
+        return (tuple(cell) for cell in np.argwhere(~self.occupancy).tolist())
+
+    def __len__(self):
+        return int(self.occupancy.size - np.count_nonzero(self.occupancy))
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        for cell in self:
+            yield self[cell]
+
+    def items(self):
+        for cell in self:
+            yield cell, self[cell]
+
+
+class OctileHeuristic:
+    '''Octile distance to one goal cell of a GridMap.'''
+
+    def __init__(self, grid, goal):
+        self.grid = grid
+        self.goal = goal
+
+    def __getitem__(self, cell):
+        rows, cols = abs(cell[0] - self.goal[0]), abs(cell[1] - self.goal[1])
+        return max(rows, cols) + (_SQRT2 - 1) * min(rows, cols)
+
+    def get(self, cell, default=None):
+        if cell not in self.grid:
+            return default
+        return self[cell]
+
+    def lookup(self, graph):
+        '''Returns a function node_id -> estimate for ids of graph.'''
+        names = graph.names
+        return lambda node_id: self[names[node_id]]
+
+
+def _jump(grid, node, dr, dc, goal):
+    '''
+    Walks from node in direction (dr, dc) and returns the first jump point:
+    the goal, a cell with a forced neighbor, or (moving diagonally) a cell
+    from which a straight scan finds one. Returns -1 at an obstacle.
+    '''
+    free, width = grid._free, grid._width
+    step = dr * width + dc
+    while True:
+        if dr and dc and not (free[node + dr * width] and free[node + dc]):
+            return -1
+        node += step
+        if not free[node]:
+            return -1
+        if node == goal:
+            return node
+        if dr and dc:
+            if _jump(grid, node, dr, 0, goal) >= 0 or _jump(grid, node, 0, dc, goal) >= 0:
+                return node
+        elif dc:
+            # a side cell that is free now but was blocked one step back can only be reached through node
+            if (free[node - width] and not free[node - width - dc]) or (free[node + width] and not free[node + width - dc]):
+                return node
+        elif (free[node - 1] and not free[node - step - 1]) or (free[node + 1] and not free[node - step + 1]):
+            return node
+
+
+def _jump_directions(dr, dc):
+    '''Directions to scan from a jump point that was entered moving in (dr, dc).'''
+    if dr and dc:
+        return ((dr, dc), (dr, 0), (0, dc))
+    if dc:
+        return ((0, dc), (1, 0), (-1, 0), (1, dc), (-1, dc))
+    return ((dr, 0), (0, 1), (0, -1), (dr, 1), (dr, -1))
+
+
+_ALL_DIRECTIONS = tuple((dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc)
+
+
+def jump_point_search(grid, start, goal, stats=None):
+    '''
+    A* with Jump Point Search on a GridMap.
+    Returns (path, total_cost) where path lists every cell from start to goal.
+    stats: optional SearchStats that records this search
+    '''
+    run = stats.start("jump_point_search") if stats is not None else None
+    width = grid._width
+    source, target = grid._node(start), grid._node(goal)
+    goal_row, goal_col = divmod(target, width)
+
+    def h(node):
+        row, col = divmod(node, width)
+        rows, cols = abs(row - goal_row), abs(col - goal_col)
+        return max(rows, cols) + (_SQRT2 - 1) * min(rows, cols)
+
+    g_score = {source: 0}
+    f_score = {source: h(source)}
+    open_set = [(f_score[source], source)]
+    came_from = {}
+
+    while open_set:
+        current_f_score, current = heapq.heappop(open_set)
+        if current_f_score > f_score.get(current, float('inf')):
+            if run:
+                run.stale_pops += 1
+            continue
+
+        if current == target:
+            if run:
+                stats.finish(run)
+            jump_points = reconstruct_path(came_from, current)
+            path = [grid._cell(source)]
+            for node, successor in zip(jump_points, jump_points[1:]):
+                (row, col), (next_row, next_col) = divmod(node, width), divmod(successor, width)
+                dr, dc = (next_row > row) - (next_row < row), (next_col > col) - (next_col < col)
+                while (row, col) != (next_row, next_col):
+                    row, col = row + dr, col + dc
+                    path.append((row - 1, col - 1))
+            return path, g_score[current]
+
+        if run:
+            run.expand(current)
+        row, col = divmod(current, width)
+        if current in came_from:
+            parent_row, parent_col = divmod(came_from[current], width)
+            directions = _jump_directions((row > parent_row) - (row < parent_row), (col > parent_col) - (col < parent_col))
+        else:
+            directions = _ALL_DIRECTIONS
+        for dr, dc in directions:
+            jump_point = _jump(grid, current, dr, dc, target)
+            if jump_point < 0:
+                continue
+            steps = max(abs(jump_point // width - row), abs(jump_point % width - col))
+            tentative_g = g_score[current] + (steps * _SQRT2 if dr and dc else steps)
+            if tentative_g < g_score.get(jump_point, float('inf')):
+                came_from[jump_point] = current
+                g_score[jump_point] = tentative_g
+                total_f = tentative_g + h(jump_point)
+                f_score[jump_point] = total_f
+                heapq.heappush(open_set, (total_f, jump_point))
+                if run:
+                    run.push(len(open_set))
+
+    if run:
+        stats.finish(run)
+    raise ValueError(f"No path found from {start} to {goal}")
+
+
+# ## Certified consistent heuristics
+# With a consistent heuristic A* settles every node on its first expansion, so re-opening closed nodes is never needed. `certify_heuristic(graph, heuristic, goal)` runs `check_heuristic` once and returns a `CertifiedHeuristic` that can be cached and reused for all searches towards that goal on the same map. `a_star_search` recognizes it (with `epsilon=0` and the default queue) and switches to a strict closed-set engine: a node is expanded at most once, closed nodes are never pushed again, and there is no `f_score` table.
+# 
+# - The certificate is tied to the map object and, for a `VersionedMap`, to its version; after an edge update the search falls back to the general engine.
+# - `CertifiedHeuristic(heuristic, graph, goal)` skips the check, e.g. for a heuristic that was validated before and stored.
+# 
+
+# In[ ]:
+
+
+class CertifiedHeuristic:
+    '''
+    A heuristic known to be consistent towards goal on graph.
+    Behaves like the wrapped heuristic (dict, heuristic object or id-indexed
+    sequence) and tells a_star_search that a closed set is safe.
+    '''
+
+    def __init__(self, heuristic, graph, goal):
+        self.heuristic = heuristic
+        self.graph = graph
+        self.goal = goal
+        self.version = getattr(graph, 'version', None)
+
+    def certifies(self, graph, goal):
+        '''True if the certificate holds for a search towards goal on graph.'''
+        return graph is self.graph and goal == self.goal and getattr(graph, 'version', None) == self.version
+
+    def __getitem__(self, node):
+        return self.heuristic[node]
+
+    def get(self, node, default=None):
+        return self.heuristic.get(node, default)
+
+    def lookup(self, graph):
+        '''Returns a function node_id -> estimate for ids of graph.'''
+        return _heuristic_lookup(graph, self.heuristic)
+
+    def array(self, graph):
+        '''All estimates for the ids of graph.'''
+        return _heuristic_array(graph, self.heuristic)
+
+
+def certify_heuristic(graph, heuristic, goal):
+    '''
+    Checks once that heuristic is consistent towards goal and returns it as
+    a CertifiedHeuristic. Raises ValueError if it is not consistent.
+    '''
+    _, consistent = check_heuristic(graph, heuristic, goal)
+    if not consistent:
+        raise ValueError(f"Heuristic is not consistent towards {goal}")
+    return CertifiedHeuristic(heuristic, graph, goal)
+
+
+def _a_star_search_closed(graph, start, goal, heuristic, stats=None):
+    '''a_star_search for a consistent heuristic, every node is expanded at most once.'''
+    run = stats.start("a_star_search") if stats is not None else None
+    compiled = isinstance(graph, CompiledGraph)
+    if compiled:
+        neighbors, h = graph.edges, _heuristic_lookup(graph, heuristic)
+        source, target = graph.index[start], graph.index[goal]
+    else:
+        neighbors, h = (lambda node: graph.get(node, [])), heuristic.__getitem__
+        source, target = start, goal
+
+    g_score = {source: 0}
+    came_from = {}
+    closed = set()
+    open_set = [(h(source), source)]
+
+    while open_set:
+        _, current = heapq.heappop(open_set)
+        if current in closed:
+            # an open node whose g was lowered after it was pushed
+            if run:
+                run.stale_pops += 1
+            continue
+
+        if current == target:
+            if run:
+                stats.finish(run)
+            path = reconstruct_path(came_from, current)
+            if compiled:
+                path = [graph.names[node_id] for node_id in path]
+            return path, g_score[current]
+
+        closed.add(current)
+        if run:
+            run.expand(current)
+        g_current = g_score[current]
+        for neighbor, edge_cost in neighbors(current):
+            if neighbor in closed:
+                continue
+            tentative_g = g_current + edge_cost
+            if tentative_g < g_score.get(neighbor, float('inf')):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                heapq.heappush(open_set, (tentative_g + h(neighbor), neighbor))
+                if run:
+                    run.push(len(open_set))
+
+    if run:
+        stats.finish(run)
+    raise ValueError(f"No path found from {start} to {goal}")
+
+
+# ## Parallel A* (HDA*)
+# `hda_star_search` is hash-distributed A*: every node is owned by one worker process, chosen by a hash of its id. A worker keeps the open list and g-values of its own nodes only; successors owned by another worker are sent to it in batches through its inbox queue. Shared memory holds the heuristic, the parent of every node (written only by its owner), the best goal cost found so far and the counters used for termination.
+# 
+# - A goal cost is only an upper bound while other workers may still hold nodes with a smaller f, so the search ends when every worker is idle (nothing below the bound left) and no batch is in flight. Both are updated under one lock, which makes the test race-free. The result is the optimal `(path, cost)` for an admissible heuristic.
+# - Nodes can be expanded more than once, when a cheaper path reaches a worker after the node was expanded; `stats` reports these as `re_expansions`.
+# - `hda_star_scaling` runs the search for several worker counts and reports wall time, speedup over one worker and the expansion overhead. The speedup depends on the CPU cores available and on how much work there is per message, small maps are faster with `a_star_search`.
+# - With the `spawn` start method (the default on macOS and Windows) every worker imports the defining module, so call `hda_star_search` from a script under `if __name__ == "__main__":`; a notebook kernel's `__main__` cannot be imported by the workers. If a worker crashes the search raises `RuntimeError`.
+# 
+
+# In[ ]:
+
+
+import multiprocessing
+import multiprocessing.connection
+import queue as queue_module
+
+_HDA_COUNTERS = ("expansions", "pushes", "stale_pops", "re_expansions")
+
+
+def _hda_owner(node_id, workers):
+    # multiplicative hashing spreads neighboring ids over the workers
+    return (node_id * 2654435761 & 0xFFFFFFFF) % workers
+
+
+def _hda_worker(rank, graph, source, target, h, parents, inboxes, shared, batch_size):
+    '''Search loop of worker rank, see hda_star_search.'''
+    lock, incumbent, in_flight, idle, done, counters = shared
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    workers = len(inboxes)
+    inbox = inboxes[rank]
+    g_score = {}
+    open_set = []
+    expanded = set()
+    expansions = pushes = stale_pops = re_expansions = 0
+    if _hda_owner(source, workers) == rank:
+        g_score[source] = 0
+        open_set.append((h[source], source))
+
+    while True:
+        batches = []
+        if idle[rank]:
+            try:
+                batches.append(inbox.get(timeout=0.01))
+            except queue_module.Empty:
+                if done.value:
+                    break
+                continue
+        while True:
+            try:
+                batches.append(inbox.get_nowait())
+            except queue_module.Empty:
+                break
+        for batch in batches:
+            for f, g, node, parent in batch:
+                if g < g_score.get(node, float('inf')):
+                    g_score[node] = g
+                    parents[node] = parent
+                    heapq.heappush(open_set, (f, node))
+                    pushes += 1
+        if batches:
+            with lock:
+                idle[rank] = 0
+                in_flight.value -= len(batches)
+
+        outboxes = [[] for _ in range(workers)]
+        for _ in range(batch_size):
+            if not open_set or open_set[0][0] >= incumbent.value:
+                break
+            f, node = heapq.heappop(open_set)
+            g_node = g_score[node]
+            if f > g_node + h[node]:
+                stale_pops += 1
+                continue
+            if node == target:
+                with lock:
+                    if g_node < incumbent.value:
+                        incumbent.value = g_node
+                continue
+            expansions += 1
+            if node in expanded:
+                re_expansions += 1
+            expanded.add(node)
+            for e in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[e]
+                tentative_g = g_node + weights[e]
+                total_f = tentative_g + h[neighbor]
+                if total_f >= incumbent.value:
+                    continue
+                owner = _hda_owner(neighbor, workers)
+                if owner != rank:
+                    outboxes[owner].append((total_f, tentative_g, neighbor, node))
+                elif tentative_g < g_score.get(neighbor, float('inf')):
+                    g_score[neighbor] = tentative_g
+                    parents[neighbor] = node
+                    heapq.heappush(open_set, (total_f, neighbor))
+                    pushes += 1
+
+        outgoing = [(owner, batch) for owner, batch in enumerate(outboxes) if batch]
+        if outgoing:
+            # count the batches before they can be received
+            with lock:
+                in_flight.value += len(outgoing)
+            for owner, batch in outgoing:
+                inboxes[owner].put(batch)
+        elif not open_set or open_set[0][0] >= incumbent.value:
+            with lock:
+                idle[rank] = 1
+                if in_flight.value == 0 and all(idle):
+                    done.value = 1
+
+    counters[rank * 4:rank * 4 + 4] = [expansions, pushes, stale_pops, re_expansions]
+
+
+def hda_star_search(graph, start, goal, heuristic, workers=None, batch_size=64, stats=None):
+    '''
+    Hash-distributed parallel A* over worker processes.
+    Returns (path, total_cost) where path includes start and goal.
+    workers:    number of processes (default: CPU count)
+    batch_size: nodes a worker expands between exchanging messages
+    stats:      optional SearchStats that records the summed worker counters
+    '''
+    graph = as_compiled(graph)
+    workers = workers or os.cpu_count() or 1
+    source, target = graph.index[start], graph.index[goal]
+    run = stats.start("hda_star_search") if stats is not None else None
+    h = multiprocessing.RawArray('d', _heuristic_array(graph, heuristic))
+    parents = multiprocessing.RawArray('i', graph.num_nodes)
+    parents[source] = -1
+    shared = (
+        multiprocessing.Lock(),
+        multiprocessing.RawValue('d', float('inf')),  # best goal cost so far
+        multiprocessing.RawValue('q', 0),             # batches sent but not yet processed
+        multiprocessing.RawArray('b', workers),       # 1 while a worker has nothing to do
+        multiprocessing.RawValue('b', 0),             # set once the search is finished
+        multiprocessing.RawArray('q', 4 * workers),   # _HDA_COUNTERS per worker
+    )
+    inboxes = [multiprocessing.Queue() for _ in range(workers)]
+    processes = [multiprocessing.Process(target=_hda_worker,
+                                         args=(rank, graph, source, target, h, parents, inboxes, shared, batch_size))
+                 for rank in range(workers)]
+    for process in processes:
+        process.start()
+    running, failed = processes, []
+    while running and not failed:
+        multiprocessing.connection.wait([process.sentinel for process in running])
+        running = [process for process in running if process.exitcode is None]
+        failed = [(rank, process.exitcode) for rank, process in enumerate(processes) if process.exitcode]
+    # the others would wait forever for a crashed worker to become idle
+    for process in running:
+        process.terminate()
+    for process in processes:
+        process.join()
+    if failed:
+        raise RuntimeError(f"HDA* worker crashed, (rank, exit code): {failed}")
+
+    counters = shared[5]
+    if run:
+        for i, name in enumerate(_HDA_COUNTERS):
+            setattr(run, name, sum(counters[i::4]))
+        stats.finish(run)
+    cost = shared[1].value
+    if cost == float('inf'):
+        raise ValueError(f"No path found from {start} to {goal}")
+    path = [target]
+    while path[-1] != source:
+        path.append(parents[path[-1]])
+    return [graph.names[node_id] for node_id in reversed(path)], cost
+
+
+def hda_star_scaling(graph, start, goal, heuristic, workers=(1, 2, 4, 8), batch_size=64):
+    '''
+    Runs hda_star_search once per worker count and returns one dict per run
+    with the wall time, the speedup over the first run and the expansions
+    relative to the first run (the search overhead of more workers).
+    '''
+    graph = as_compiled(graph)
+    heuristic = _heuristic_array(graph, heuristic)
+    report = []
+    for count in workers:
+        stats = SearchStats()
+        _, cost = hda_star_search(graph, start, goal, heuristic, count, batch_size, stats)
+        report.append({"workers": count, "cost": cost, "wall_time": stats.wall_time,
+                       "expansions": stats.expansions, "re_expansions": stats.re_expansions})
+    for row in report:
+        row["speedup"] = report[0]["wall_time"] / row["wall_time"]
+        row["expansion_overhead"] = row["expansions"] / max(report[0]["expansions"], 1)
+    return report
+
+
+# ## Implicit-graph A*
+# Puzzle and planning state spaces are too large to store as a map. `implicit_a_star_search(start, goal, successors, heuristic)` generates them on the fly: `successors(state)` yields `(next_state, cost)` pairs and `heuristic(state)` estimates the remaining cost. `goal` is a goal state or a function `state -> bool`. It returns `(path, cost)` like `a_star_search`, with the states along the path.
+# 
+# - With `encode` and `decode` the search stores every state as a packed key (an int or `bytes`) and only decodes a state when it is expanded. `pack_values` / `unpack_values` pack a sequence of small non-negative ints into one int, e.g. the tiles of a sliding puzzle with 4 bits each.
+# - The duplicate-detection table `StateTable` maps each key to a slot in flat arrays holding g and the parent slot; the open list only holds `(f, g, slot)` entries. `max_table_bytes` caps its estimated size, the search raises `ValueError` when a new state would exceed the cap.
+# 
+
+# In[ ]:
+
+
+import sys
+
+# dict entry, slot int, slot -> key list and the g / parent arrays, measured per state
+_STATE_ENTRY_BYTES = 96
+
+
+def pack_values(values, bits):
+    '''Packs small non-negative ints into one int, bits per value, first value lowest.'''
+    key = 0
+    for shift, value in enumerate(values):
+        key |= value << (shift * bits)
+    return key
+
+
+def unpack_values(key, length, bits):
+    '''Inverse of pack_values, returns a tuple of length values.'''
+    mask = (1 << bits) - 1
+    return tuple((key >> (shift * bits)) & mask for shift in range(length))
+
+
+class StateTable:
+    '''
+    Duplicate-detection table of an implicit search.
+    slots:   dict key -> slot
+    keys:    slot -> key
+    g:       array of the best known cost per slot
+    parents: array of parent slots, -1 for the start
+    max_bytes: optional cap on the estimated size in bytes
+    '''
+
+    def __init__(self, max_bytes=None):
+        self.slots = {}
+        self.keys = []
+        self.g = array('d')
+        self.parents = array('q')
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self.keys)
+
+    def slot(self, key):
+        '''Slot of key, a new one with g = inf if the key is unseen.'''
+        slot = self.slots.get(key)
+        if slot is None:
+            size = _STATE_ENTRY_BYTES + sys.getsizeof(key)
+            if self.max_bytes is not None and self.nbytes + size > self.max_bytes:
+                raise ValueError(f"State table exceeds {self.max_bytes} bytes after {len(self)} states")
+            self.nbytes += size
+            slot = self.slots[key] = len(self.keys)
+            self.keys.append(key)
+            self.g.append(float('inf'))
+            self.parents.append(-1)
+        return slot
+
+    def path(self, slot):
+        '''Keys from the start to slot.'''
+        path = []
+        while slot != -1:
+            path.append(self.keys[slot])
+            slot = self.parents[slot]
+        return list(reversed(path))
+
+
+def implicit_a_star_search(start, goal, successors, heuristic, encode=None, decode=None,
+                           max_table_bytes=None, stats=None):
+    '''
+    A* on a state space given by functions instead of a map.
+    Returns (path, total_cost) where path holds the states from start to goal.
+    successors:      state -> iterable of (next_state, cost)
+    heuristic:       state -> estimate of the remaining cost
+    goal:            a goal state, or a function state -> bool
+    encode / decode: state -> packed key and back, both None to use the states as keys
+    max_table_bytes: optional cap on the estimated size of the StateTable
+    stats:           optional SearchStats that records this search
+    '''
+    if (encode is None) != (decode is None):
+        raise ValueError("Pass both encode and decode, or neither")
+    run = stats.start("implicit_a_star_search") if stats is not None else None
+    if encode is None:
+        encode = decode = lambda state: state
+    if callable(goal):
+        is_goal = lambda key: goal(decode(key))
+    else:
+        goal_key = encode(goal)
+        is_goal = lambda key: key == goal_key
+
+    table = StateTable(max_table_bytes)
+    g_table = table.g
+    source = table.slot(encode(start))
+    g_table[source] = 0
+    open_set = [(heuristic(start), 0, source)]
+
+    while open_set:
+        _, g_current, current = heapq.heappop(open_set)
+        if g_current > g_table[current]:
+            if run:
+                run.stale_pops += 1
+            continue
+
+        key = table.keys[current]
+        if is_goal(key):
+            if run:
+                stats.finish(run)
+            return [decode(key) for key in table.path(current)], g_current
+
+        if run:
+            run.expand(current)
+        for next_state, edge_cost in successors(decode(key)):
+            tentative_g = g_current + edge_cost
+            neighbor = table.slot(encode(next_state))
+            if tentative_g < g_table[neighbor]:
+                g_table[neighbor] = tentative_g
+                table.parents[neighbor] = current
+                heapq.heappush(open_set, (tentative_g + heuristic(next_state), tentative_g, neighbor))
+                if run:
+                    run.push(len(open_set))
+
+    if run:
+        stats.finish(run)
+    raise ValueError(f"No path found from {start} to {goal}")
+
+
+# ## Reusable search workspace
+# Every `a_star_search` call builds fresh `g_score`, `f_score` and `came_from` dicts. A `SearchWorkspace` holds these as preallocated arrays indexed by node id, plus a generation stamp per node. A search increments the generation and treats every node whose stamp differs as unseen, so resetting costs O(1) instead of clearing or reallocating O(V) buffers. The heap list is kept and cleared as well.
+# 
+# - `a_star_search(graph, start, goal, heuristic, workspace=ws)` runs on the buffers of `ws = SearchWorkspace(graph)`; keep one workspace per worker (thread or process) and reuse it for all its queries. Only the heap entries and the returned path are allocated per query.
+# - A dict map is compiled once when the workspace is built, so costs are floats as on a `CompiledGraph`. After an edit of a `VersionedMap` the workspace refuses the map and has to be rebuilt.
+# 
+
+# In[ ]:
+
+
+class SearchWorkspace:
+    '''
+    Reusable per-node buffers for repeated searches on one graph.
+    g, f, parents: id-indexed arrays, the entry of node v is only valid
+                   while stamps[v] == generation
+    open_set:      heap list, cleared for every search
+    '''
+
+    def __init__(self, graph):
+        self.source = graph
+        self.version = getattr(graph, 'version', None)
+        self.graph = as_compiled(graph)
+        num_nodes = self.graph.num_nodes
+        self.g = array('d', [0.0]) * num_nodes
+        self.f = array('d', [0.0]) * num_nodes
+        self.parents = array('i', [-1]) * num_nodes
+        self.stamps = array('q', [0]) * num_nodes
+        self.generation = 0
+        self.open_set = []
+
+    def compiled(self, graph):
+        '''The CompiledGraph for graph, which must be the graph this workspace was built for.'''
+        if graph is self.graph:
+            return graph
+        if graph is self.source and getattr(graph, 'version', None) == self.version:
+            return self.graph
+        raise ValueError("SearchWorkspace was built for a different graph or an older version of it")
+
+    def begin(self):
+        '''Starts a new search in O(1), afterwards every node counts as unseen.'''
+        self.generation += 1
+        self.open_set.clear()
+        return self.generation
+
+
+def _a_star_search_workspace(graph, start, goal, heuristic, epsilon, stats, workspace):
+    '''a_star_search on the preallocated buffers of a SearchWorkspace.'''
+    run = stats.start("a_star_search") if stats is not None else None
+    graph = workspace.compiled(graph)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    g_score, f_score, parents, stamps = workspace.g, workspace.f, workspace.parents, workspace.stamps
+    h = _heuristic_lookup(graph, heuristic)
+    weight = 1 + epsilon
+    start_id, goal_id = graph.index[start], graph.index[goal]
+
+    generation = workspace.begin()
+    open_set = workspace.open_set
+    stamps[start_id] = generation
+    g_score[start_id] = 0
+    f_score[start_id] = weight * h(start_id)
+    parents[start_id] = -1
+    open_set.append((f_score[start_id], start_id))
+
+    while open_set:
+        current_f_score, current = heapq.heappop(open_set)
+
+        if current_f_score > f_score[current]:
+            if run:
+                run.stale_pops += 1
+            continue
+
+        if current == goal_id:
+            if run:
+                stats.finish(run)
+            path = [current]
+            while parents[path[-1]] != -1:
+                path.append(parents[path[-1]])
+            return [graph.names[node_id] for node_id in reversed(path)], g_score[current]
+
+        if run:
+            run.expand(current)
+        g_current = g_score[current]
+        for e in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[e]
+            tentative_g = g_current + weights[e]
+            if stamps[neighbor] != generation or tentative_g < g_score[neighbor]:
+                stamps[neighbor] = generation
+                parents[neighbor] = current
+                g_score[neighbor] = tentative_g
+                total_f = tentative_g + weight * h(neighbor)
+                f_score[neighbor] = total_f
+                heapq.heappush(open_set, (total_f, neighbor))
+                if run:
+                    run.push(len(open_set))
+
+    if run:
+        stats.finish(run)
+    raise ValueError(f"No path found from {start} to {goal}")
+
+
 # ## Quick checks
 # Uncomment to sanity-check your solution on multiple datasets and heuristics.
 # 
@@ -367,3 +3778,91 @@ print(check_heuristic(toy_map, toy_heuristic_bad, "Goal"))
 print(check_heuristic(islands_map, islands_heuristic_good, "Goal"))
 print(check_heuristic(islands_map, islands_heuristic_bad, "Goal"))
 
+romania_compiled = CompiledGraph.from_map(romania_map)
+print("Romania A* (compiled):", a_star_search(romania_compiled, "Arad", "Bucharest", straight_line_heuristic))
+
+_, radius_costs = dijkstra(romania_map, ["Bucharest", "Arad"], radius=150)
+print("Within 150 of Bucharest or Arad:", sum(cost < float('inf') for cost in radius_costs))
+
+print("Romania bidirectional A*:", bidirectional_a_star_search(romania_map, "Arad", "Bucharest", straight_line_heuristic))
+
+romania_landmarks = LandmarkIndex.build(romania_map, k=3)
+alt_to_craiova = romania_landmarks.heuristic("Craiova")
+print("Romania ALT A*:", a_star_search(romania_map, "Neamt", "Craiova", alt_to_craiova))
+print(check_heuristic(romania_map, alt_to_craiova, "Craiova"))
+
+romania_ch = ContractionHierarchy.build(romania_map)
+print("Romania CH:", romania_ch.query("Arad", "Bucharest"), romania_ch.num_shortcuts, "shortcuts")
+
+print("Germany distance matrix:")
+print(distance_matrix(germany_map, ["Hamburg", "Munich"], ["Berlin", "Cologne", "Stuttgart"]))
+
+route_cache = RouteCache(maxsize=2)
+live_germany = VersionedMap(germany_map)
+route_cache.a_star_search(live_germany, "Hamburg", "Berlin", straight_line_heuristic_berlin)
+route_cache.a_star_search(live_germany, "Hamburg", "Berlin", straight_line_heuristic_berlin)
+live_germany.set_edge("Hamburg", "Berlin", 900)
+print("Germany A* after edge update:", route_cache.a_star_search(live_germany, "Hamburg", "Berlin", straight_line_heuristic_berlin), route_cache.stats())
+
+print("Romania DFS order from Arad:", list(depth_first_order(romania_map, "Arad"))[:6])
+
+romania_planner = IncrementalPlanner(romania_map, "Arad", "Bucharest", straight_line_heuristic)
+romania_planner.plan()
+romania_planner.update_edge("Pitesti", "Bucharest", 250)
+romania_planner.update_edge("Bucharest", "Pitesti", 250)
+print("Romania replanned:", romania_planner.plan(), romania_planner.last_expansions, "expansions")
+
+for report in check_heuristics(germany_map, [straight_line_heuristic_berlin, straight_line_heuristic_berlin_bad], "Berlin"):
+    print(report.admissible, report.consistent, report.inadmissible_nodes)
+
+import tempfile
+
+with tempfile.TemporaryDirectory() as graph_dir:
+    save_graph(romania_map, os.path.join(graph_dir, "romania.graph"))
+    with open_graph(os.path.join(graph_dir, "romania.graph")) as romania_mapped:
+        print("Romania A* (mmap):", a_star_search(romania_mapped, "Arad", "Bucharest", straight_line_heuristic))
+    romania_pairs = build_all_pairs(romania_map, os.path.join(graph_dir, "romania"), processes=1)
+    print("Romania all pairs:", romania_pairs.lookup("Arad", "Bucharest"), romania_pairs.path("Arad", "Bucharest"))
+    romania_pairs.close()
+
+print("Romania weighted A*:", a_star_search(romania_map, "Arad", "Bucharest", straight_line_heuristic, epsilon=1.0))
+for anytime_path, anytime_cost in anytime_a_star_search(romania_map, "Arad", "Bucharest", straight_line_heuristic, epsilon=3.0):
+    print("Romania anytime A*:", anytime_path, anytime_cost)
+
+romania_stats = SearchStats()
+a_star_search(romania_map, "Arad", "Bucharest", straight_line_heuristic, stats=romania_stats)
+depth_first_search(romania_map, "Arad", "Bucharest", stats=romania_stats)
+print("Romania search stats:", {key: value for key, value in romania_stats.as_dict().items() if key != "wall_time"})
+
+print("Romania IDA*:", ida_star_search(romania_map, "Arad", "Bucharest", straight_line_heuristic))
+print("Romania SMA* (8 nodes):", sma_star_search(romania_map, "Arad", "Bucharest", straight_line_heuristic, max_nodes=8))
+
+print("Romania A* (indexed heap):", a_star_search(romania_map, "Arad", "Bucharest", straight_line_heuristic, queue="indexed"))
+print("Indexed Dijkstra matches:", compute_true_costs(romania_map, "Bucharest", queue="indexed") == compute_true_costs(romania_map, "Bucharest"))
+
+germany_positions = NodeCoordinates(germany_coordinates, metric="haversine")
+print("Germany A* with haversine heuristic:", a_star_search(germany_map, "Hamburg", "Munich", germany_positions.heuristic("Munich")),
+      check_heuristic(germany_map, germany_positions.heuristic("Munich"), "Munich"))
+
+for alternative_path, alternative_cost in k_shortest_paths(romania_map, "Arad", "Bucharest", 3):
+    print("Romania alternative:", alternative_path, alternative_cost)
+
+warehouse = GridMap.from_strings([
+    "..........",
+    "..####....",
+    "......#...",
+    "..#...#...",
+    "..#.......",
+])
+print("Warehouse A*:", a_star_search(warehouse, (0, 0), (4, 9), warehouse.heuristic((4, 9))))
+print("Warehouse JPS:", jump_point_search(warehouse, (0, 0), (4, 9)))
+
+certified_to_bucharest = certify_heuristic(romania_map, straight_line_heuristic, "Bucharest")
+print("Romania A* (certified heuristic):", a_star_search(romania_map, "Arad", "Bucharest", certified_to_bucharest))
+
+print("Romania implicit A*:", implicit_a_star_search("Arad", "Bucharest", romania_map.__getitem__, straight_line_heuristic.__getitem__))
+
+romania_workspace = SearchWorkspace(romania_map)
+for workspace_start in ("Arad", "Timisoara", "Neamt"):
+    print("Romania A* (workspace):", a_star_search(romania_map, workspace_start, "Bucharest", straight_line_heuristic, workspace=romania_workspace))
+